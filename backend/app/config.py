@@ -1,5 +1,6 @@
 """Application configuration using pydantic-settings."""
 
+import os
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +17,8 @@ class Settings(BaseSettings):
 
     # Workspace configuration
     workspace_path: Path = Path.home() / "projects"
+    # Max threads probing project directories in large workspaces
+    projects_scan_concurrency: int = min(32, (os.cpu_count() or 1) * 4)
 
     # API configuration
     api_host: str = "0.0.0.0"
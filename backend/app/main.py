@@ -1,6 +1,8 @@
 """FastAPI application for Claude Dev Container."""
 
 import shlex
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Literal
 
 from fastapi import FastAPI, HTTPException, Query, Request
@@ -23,13 +25,27 @@ from app.services.beads import BeadsService
 from app.services.containers import ContainerService
 from app.services.projects import ProjectService
 
+# Per-minute request limits per client address
+READ_RATE_LIMIT = 60  # project/bead reads and attach info
+EXEC_RATE_LIMIT = 10  # endpoints that run Claude or git inside a container
+PROGRESS_RATE_LIMIT = 120  # progress polling during long runs
+
 # Initialize rate limiter with in-memory storage (default)
 limiter = Limiter(key_func=get_remote_address)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release service resources when the application shuts down."""
+    yield
+    project_service.close()
+
+
 app = FastAPI(
     title="Claude Dev Container",
     description="Backend API for Claude Dev Container PWA",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add rate limiter to app state and exception handler
@@ -63,14 +79,14 @@ async def health_check() -> dict[str, str]:
 
 
 @app.get("/api/projects")
-@limiter.limit("60/minute")
+@limiter.limit(f"{READ_RATE_LIMIT}/minute")
 async def list_projects(request: Request) -> list[Project]:
     """List projects in ~/projects/."""
     return project_service.list_projects()
 
 
 @app.get("/api/projects/{project_id}")
-@limiter.limit("60/minute")
+@limiter.limit(f"{READ_RATE_LIMIT}/minute")
 async def get_project(request: Request, project_id: str) -> Project:
     """Get project details + container status."""
     project = project_service.get_project(project_id)
@@ -85,7 +101,7 @@ async def get_project(request: Request, project_id: str) -> Project:
 
 
 @app.get("/api/projects/{project_id}/beads")
-@limiter.limit("60/minute")
+@limiter.limit(f"{READ_RATE_LIMIT}/minute")
 async def list_beads(
     request: Request,
     project_id: str,
@@ -115,7 +131,7 @@ async def list_beads(
 
 
 @app.post("/api/projects/{project_id}/work/{bead_id}")
-@limiter.limit("10/minute")
+@limiter.limit(f"{EXEC_RATE_LIMIT}/minute")
 async def work_on_bead(
     request: Request,
     project_id: str,
@@ -166,7 +182,7 @@ async def work_on_bead(
 
 
 @app.post("/api/projects/{project_id}/review")
-@limiter.limit("10/minute")
+@limiter.limit(f"{EXEC_RATE_LIMIT}/minute")
 async def review_work(request: Request, project_id: str) -> ExecutionResult:
     """Run Claude review on current branch.
 
@@ -201,7 +217,7 @@ async def review_work(request: Request, project_id: str) -> ExecutionResult:
 
 
 @app.post("/api/projects/{project_id}/push-pr")
-@limiter.limit("10/minute")
+@limiter.limit(f"{EXEC_RATE_LIMIT}/minute")
 async def push_and_create_pr(
     request: Request,
     project_id: str,
@@ -281,7 +297,7 @@ async def push_and_create_pr(
 
 
 @app.get("/api/projects/{project_id}/progress")
-@limiter.limit("120/minute")
+@limiter.limit(f"{PROGRESS_RATE_LIMIT}/minute")
 async def get_progress(request: Request, project_id: str) -> ProgressInfo:
     """Get current execution progress (for refresh button during long runs).
 
@@ -298,7 +314,7 @@ async def get_progress(request: Request, project_id: str) -> ProgressInfo:
 
 
 @app.get("/api/projects/{project_id}/attach")
-@limiter.limit("60/minute")
+@limiter.limit(f"{READ_RATE_LIMIT}/minute")
 async def get_attach_info(request: Request, project_id: str) -> AttachInfo:
     """Return info needed to attach to container.
 
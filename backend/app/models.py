@@ -2,7 +2,7 @@
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecutionState(str, Enum):
@@ -34,6 +34,9 @@ class BeadType(str, Enum):
 class Project(BaseModel):
     """Project model representing a workspace project."""
 
+    # Immutable so ProjectService can hand out cached instances safely
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique project identifier")
     name: str = Field(..., description="Project name")
     path: str = Field(..., description="Absolute path to project")
@@ -1,11 +1,15 @@
 """Beads service for wrapping the bd CLI tool."""
 
+import json
 import logging
 import re
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
 
+from pydantic import ValidationError
+
 from app.models import Bead, BeadStatus, BeadType
 
 logger = logging.getLogger(__name__)
@@ -13,6 +17,50 @@ logger = logging.getLogger(__name__)
 # Default timeout for subprocess commands (in seconds)
 BD_COMMAND_TIMEOUT = 30
 
+# bd list line: id [P0-4] [type] status - title
+# Matched over the whole output with MULTILINE; [^\S\n] is whitespace that
+# never crosses a line boundary.
+_LIST_RE = re.compile(
+    r"^[^\S\n]*(?P<id>\S+)[^\S\n]+\[P(?P<pri>\d+)\][^\S\n]+\[(?P<type>\w+)\]"
+    r"[^\S\n]+(?P<status>\w+)[^\S\n]+-[^\S\n]+(?P<title>.+?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# String -> enum lookups for bead fields (unknown values fall back to defaults)
+_STATUS_MAP = {status.value: status for status in BeadStatus}
+_TYPE_MAP = {bead_type.value: bead_type for bead_type in BeadType}
+
+# bd show output: "id: title" header, "Key: value" fields, then a trailing
+# free-form "Description:" block
+_SHOW_HEADER_RE = re.compile(r"\A([^:\n]*):(.*)")
+_SHOW_FIELD_RE = re.compile(r"^(Status|Priority|Type):(.*)$", re.MULTILINE)
+_SHOW_DESC_RE = re.compile(r"^Description:(.*)", re.MULTILINE | re.DOTALL)
+
+# Absolute path to bd, resolved on first use
+_bd_executable: str | None = None
+
+
+def _resolve_bd_executable() -> str:
+    """Resolve the bd executable once so each call skips the PATH search.
+
+    Returns:
+        Absolute path to bd, or "bd" if it is not on PATH (not cached, so a
+        later install is picked up).
+    """
+    global _bd_executable
+    if _bd_executable is None:
+        found = shutil.which("bd")
+        if found is None:
+            return "bd"
+        _bd_executable = found
+    return _bd_executable
+
+
+def _forget_bd_executable() -> None:
+    """Drop the cached bd path so the next call searches PATH again."""
+    global _bd_executable
+    _bd_executable = None
+
 
 class BeadsService:
     """Service for interacting with the beads CLI (bd)."""
@@ -47,21 +95,29 @@ class BeadsService:
         effective_timeout = timeout if timeout is not None else BD_COMMAND_TIMEOUT
 
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=effective_timeout,
-            )
-            # Log stderr if command failed
-            if result.returncode != 0 and result.stderr:
-                logger.warning(
-                    "bd command failed: %s (exit code %d): %s",
-                    " ".join(cmd),
-                    result.returncode,
-                    result.stderr.strip(),
-                )
+            try:
+                result = self._spawn_bd(cmd, effective_timeout)
+            except OSError:
+                if _bd_executable is None:
+                    raise
+                # Cached path went stale (bd moved or reinstalled): look it up again
+                _forget_bd_executable()
+                result = self._spawn_bd(cmd, effective_timeout)
+            # Log failures, with bd's stderr when it wrote any
+            if result.returncode != 0:
+                if result.stderr:
+                    logger.warning(
+                        "bd command failed: %s (exit code %d): %s",
+                        " ".join(cmd),
+                        result.returncode,
+                        result.stderr.strip(),
+                    )
+                else:
+                    logger.warning(
+                        "bd command failed: %s (exit code %d)",
+                        " ".join(cmd),
+                        result.returncode,
+                    )
             return result
         except subprocess.TimeoutExpired as e:
             logger.error(
@@ -77,43 +133,56 @@ class BeadsService:
             logger.error("Failed to execute bd command: %s - %s", " ".join(cmd), e)
             raise RuntimeError(f"Failed to execute bd command: {e}") from e
 
-    def _parse_bd_list_output(self, output: str) -> list[dict[str, Any]]:
-        """Parse the output of bd list command.
+    def _spawn_bd(
+        self, cmd: list[str], timeout: int
+    ) -> subprocess.CompletedProcess[str]:
+        """Spawn bd via the resolved executable.
+
+        Args:
+            cmd: Full command line, starting with "bd".
+            timeout: Command timeout in seconds.
+
+        Returns:
+            CompletedProcess with stdout/stderr.
+        """
+        return subprocess.run(
+            cmd,
+            executable=_resolve_bd_executable(),
+            cwd=self.project_path,
+            # stderr is captured so failures can log bd's message
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _parse_bd_list_output_to_beads(output: str) -> list[Bead]:
+        """Parse the output of bd list command straight into Bead models.
 
         bd list outputs lines like:
         proj-abc [P1] [task] open - Title here
 
+        Unknown statuses and types fall back to open and task.
+
         Args:
             output: Raw stdout from bd list.
 
         Returns:
-            List of parsed bead dictionaries.
+            List of Bead objects.
         """
-        beads = []
-        # Pattern: id [P0-4] [type] status - title
-        pattern = r"^(\S+)\s+\[P(\d)\]\s+\[(\w+)\]\s+(\w+)\s+-\s+(.+)$"
-
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            match = re.match(pattern, line)
-            if match:
-                bead_id, priority, bead_type, status, title = match.groups()
-                beads.append(
-                    {
-                        "id": bead_id.strip(),
-                        "title": title.strip(),
-                        "status": status,
-                        "priority": int(priority),
-                        "type": bead_type,
-                    }
-                )
-
-        return beads
+        return [
+            Bead(
+                id=m["id"],
+                title=m["title"],
+                status=_STATUS_MAP.get(m["status"], BeadStatus.open),
+                priority=int(m["pri"]),
+                type=_TYPE_MAP.get(m["type"], BeadType.task),
+            )
+            for m in _LIST_RE.finditer(output)
+        ]
 
-    def _parse_bd_show_output(self, output: str) -> dict[str, Any] | None:
+    @staticmethod
+    def _parse_bd_show_output(output: str) -> dict[str, Any] | None:
         """Parse the output of bd show command.
 
         bd show outputs:
@@ -131,63 +200,93 @@ class BeadsService:
         Returns:
             Parsed bead dictionary or None if parsing fails.
         """
-        if not output.strip():
-            return None
-
-        lines = output.strip().split("\n")
-        if not lines:
+        text = output.strip()
+        if not text:
             return None
 
         # First line is "id: title"
-        first_line = lines[0]
-        if ":" not in first_line:
+        header = _SHOW_HEADER_RE.match(text)
+        if not header:
             return None
 
-        bead_id, title = first_line.split(":", 1)
         bead = {
-            "id": bead_id.strip(),
-            "title": title.strip(),
+            "id": header[1].strip(),
+            "title": header[2].strip(),
             "status": "open",
             "priority": 2,
             "type": "task",
             "description": "",
         }
 
-        description_lines = []
-        in_description = False
-
-        for line in lines[1:]:
-            if in_description:
-                description_lines.append(line)
-                continue
-
-            if line.startswith("Description:"):
-                in_description = True
-                # Check if description is on same line
-                desc_part = line[len("Description:") :].strip()
-                if desc_part:
-                    description_lines.append(desc_part)
-                continue
+        # Everything after the first "Description:" line is description text
+        body = text[header.end() :]
+        desc = _SHOW_DESC_RE.search(body)
+        fields = body[: desc.start()] if desc else body
 
-            if line.startswith("Status:"):
-                bead["status"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Priority:"):
+        for match in _SHOW_FIELD_RE.finditer(fields):
+            key, value = match[1], match[2].strip()
+            if key == "Status":
+                bead["status"] = value
+            elif key == "Priority":
                 # Priority can be "P1" or "1"
-                prio_str = line.split(":", 1)[1].strip()
-                prio_str = prio_str.replace("P", "")
                 try:
-                    bead["priority"] = int(prio_str)
+                    bead["priority"] = int(value.replace("P", ""))
                 except ValueError:
                     pass
-            elif line.startswith("Type:"):
-                bead["type"] = line.split(":", 1)[1].strip()
+            else:
+                bead["type"] = value
 
-        if description_lines:
-            bead["description"] = "\n".join(description_lines).strip()
+        if desc:
+            first_line, _, rest = desc[1].partition("\n")
+            bead["description"] = f"{first_line.strip()}\n{rest}".strip()
 
         return bead
 
-    def _dict_to_bead(self, data: dict[str, Any]) -> Bead:
+    @staticmethod
+    def _parse_bd_show_json(output: str) -> list[dict[str, Any]]:
+        """Parse the output of bd show --json.
+
+        bd emits a JSON array of issue records (or a single object for one
+        issue). Records use "issue_type" for the bead type.
+
+        Args:
+            output: Raw stdout from bd show --json.
+
+        Returns:
+            List of parsed bead dictionaries. Empty list if output is invalid.
+        """
+        try:
+            records = json.loads(output)
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse bd show --json output")
+            return []
+
+        if isinstance(records, dict):
+            records = [records]
+        # Go encodes a nil slice as null; scalars are not records either
+        if not isinstance(records, list):
+            return []
+
+        beads = []
+        for record in records:
+            if not isinstance(record, dict) or not isinstance(record.get("id"), str):
+                continue
+            priority = record.get("priority")
+            beads.append(
+                {
+                    "id": record["id"],
+                    # Null fields fall back like missing ones
+                    "title": record.get("title") or "",
+                    "status": record.get("status") or "open",
+                    "priority": 2 if priority is None else priority,
+                    "type": record.get("issue_type") or record.get("type") or "task",
+                    "description": record.get("description") or "",
+                }
+            )
+        return beads
+
+    @staticmethod
+    def _dict_to_bead(data: dict[str, Any]) -> Bead:
         """Convert a dictionary to a Bead model.
 
         Args:
@@ -196,30 +295,13 @@ class BeadsService:
         Returns:
             Bead model instance.
         """
-        # Map status string to enum
-        status_map = {
-            "open": BeadStatus.open,
-            "in_progress": BeadStatus.in_progress,
-            "closed": BeadStatus.closed,
-        }
-        status = status_map.get(data.get("status", "open"), BeadStatus.open)
-
-        # Map type string to enum
-        type_map = {
-            "task": BeadType.task,
-            "bug": BeadType.bug,
-            "feature": BeadType.feature,
-            "epic": BeadType.epic,
-        }
-        bead_type = type_map.get(data.get("type", "task"), BeadType.task)
-
         return Bead(
             id=data["id"],
             title=data["title"],
-            status=status,
+            status=_STATUS_MAP.get(data.get("status", "open"), BeadStatus.open),
             description=data.get("description"),
             priority=data.get("priority", 2),
-            type=bead_type,
+            type=_TYPE_MAP.get(data.get("type", "task"), BeadType.task),
         )
 
     def list_beads(self, status: str | None = None) -> list[Bead]:
@@ -241,11 +323,11 @@ class BeadsService:
             logger.error("Failed to list beads: %s", e)
             return []
 
-        if result.returncode != 0:
+        # No matches is the common case; skip the parse path entirely
+        if result.returncode != 0 or not result.stdout.strip():
             return []
 
-        parsed = self._parse_bd_list_output(result.stdout)
-        return [self._dict_to_bead(d) for d in parsed]
+        return self._parse_bd_list_output_to_beads(result.stdout)
 
     def get_bead(self, bead_id: str) -> Bead | None:
         """Get a specific bead by ID.
@@ -271,6 +353,40 @@ class BeadsService:
 
         return self._dict_to_bead(parsed)
 
+    def get_beads(self, bead_ids: list[str]) -> dict[str, Bead | None]:
+        """Get several beads with a single bd invocation.
+
+        Args:
+            bead_ids: The bead identifiers.
+
+        Returns:
+            Mapping of each requested ID to its Bead, or None if it was not
+            found or the bd command failed.
+        """
+        beads: dict[str, Bead | None] = dict.fromkeys(bead_ids)
+        if not bead_ids:
+            return beads
+
+        try:
+            result = self._run_bd_command(["show", "--json", *bead_ids])
+        except RuntimeError as e:
+            logger.error("Failed to get beads %s: %s", ", ".join(bead_ids), e)
+            return beads
+
+        if result.returncode != 0:
+            return beads
+
+        for data in self._parse_bd_show_json(result.stdout):
+            if data["id"] not in beads:
+                continue
+            try:
+                beads[data["id"]] = self._dict_to_bead(data)
+            except (TypeError, ValidationError):
+                # Wrongly typed fields leave just this bead as not found
+                logger.warning("Invalid bd show --json record for %s", data["id"])
+
+        return beads
+
     def get_ready_beads(self) -> list[Bead]:
         """Get beads that are ready to work on (no blockers).
 
@@ -283,11 +399,11 @@ class BeadsService:
             logger.error("Failed to get ready beads: %s", e)
             return []
 
-        if result.returncode != 0:
+        # No matches is the common case; skip the parse path entirely
+        if result.returncode != 0 or not result.stdout.strip():
             return []
 
-        parsed = self._parse_bd_list_output(result.stdout)
-        return [self._dict_to_bead(d) for d in parsed]
+        return self._parse_bd_list_output_to_beads(result.stdout)
 
     def update_bead_status(self, bead_id: str, status: str) -> bool:
         """Update a bead's status.
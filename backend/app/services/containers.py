@@ -23,13 +23,32 @@ class ContainerService:
     # Default image for dev containers
     DEFAULT_IMAGE = "claude-dev-base:latest"
 
-    def __init__(self, docker_socket: str | None = None) -> None:
+    # Optional host mounts: host path -> (container path, mode). Relative host
+    # paths are under $HOME; the first existing entry per container path wins.
+    MOUNT_CANDIDATES: dict[str, tuple[str, str]] = {
+        "/usr/local/bin/claude": ("/usr/local/bin/claude", "ro"),
+        ".local/bin/claude": ("/usr/local/bin/claude", "ro"),
+        ".claude": ("/home/claude/.claude", "rw"),
+        ".gitconfig": ("/home/claude/.gitconfig", "ro"),
+        ".ssh": ("/home/claude/.ssh", "ro"),
+    }
+
+    def __init__(
+        self,
+        docker_socket: str | None = None,
+        mount_candidates: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
         """Initialize the container service.
 
         Args:
             docker_socket: Path to Docker socket. Defaults to settings.docker_socket.
+            mount_candidates: Optional host mounts to probe. Defaults to
+                MOUNT_CANDIDATES.
         """
         self.docker_socket = docker_socket or settings.docker_socket
+        self.mount_candidates = (
+            self.MOUNT_CANDIDATES if mount_candidates is None else mount_candidates
+        )
         self._client: docker.DockerClient | None = None
         self._containers: dict[str, Any] = {}  # project_id -> container
         self._executions: dict[str, dict] = {}  # project_id -> execution info
@@ -127,33 +146,15 @@ class ContainerService:
             project_path: {"bind": "/workspace", "mode": "rw"},
         }
 
-        # Claude CLI - check multiple possible locations
-        claude_paths = [
-            Path("/usr/local/bin/claude"),
-            home / ".local/bin/claude",
-        ]
-        for claude_bin in claude_paths:
-            if claude_bin.exists():
-                volumes[str(claude_bin)] = {
-                    "bind": "/usr/local/bin/claude",
-                    "mode": "ro",
-                }
-                break
-
-        # Claude config directory
-        claude_config = home / ".claude"
-        if claude_config.exists():
-            volumes[str(claude_config)] = {"bind": "/home/claude/.claude", "mode": "rw"}
-
-        # Git configuration
-        gitconfig = home / ".gitconfig"
-        if gitconfig.exists():
-            volumes[str(gitconfig)] = {"bind": "/home/claude/.gitconfig", "mode": "ro"}
-
-        # SSH keys for git operations
-        ssh_dir = home / ".ssh"
-        if ssh_dir.exists():
-            volumes[str(ssh_dir)] = {"bind": "/home/claude/.ssh", "mode": "ro"}
+        # Claude CLI, Claude config, git config and SSH keys when present
+        bound: set[str] = set()
+        for candidate, (bind, mode) in self.mount_candidates.items():
+            if bind in bound:
+                continue
+            host_path = home / candidate
+            if host_path.exists():
+                volumes[str(host_path)] = {"bind": bind, "mode": mode}
+                bound.add(bind)
 
         return volumes
 
@@ -1,6 +1,12 @@
 """Project service for scanning and managing workspace projects."""
 
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 from app.config import settings
@@ -8,49 +14,125 @@ from app.models import Project
 
 logger = logging.getLogger(__name__)
 
+# Recent get_project misses are remembered briefly so polling clients and
+# repeated traversal probes don't hit the filesystem every time
+NEGATIVE_CACHE_TTL = 2.0  # seconds
+NEGATIVE_CACHE_SIZE = 512
+
+# list_projects results are reused while the workspace mtime is unchanged.
+# The TTL bounds staleness for changes inside a project (git init, bd init),
+# which don't touch the workspace directory's own mtime
+LIST_CACHE_TTL = 2.0  # seconds
+
+# Workspaces with fewer candidate directories are probed serially; below
+# this a thread pool costs more than it overlaps
+PARALLEL_SCAN_THRESHOLD = 32
+
+# Project ids are single directory names: no separators, no leading dot
+_VALID_NAME = re.compile(r"\A(?!\.)[A-Za-z0-9._-]{1,128}\Z")
+
 
 class ProjectService:
     """Service for managing workspace projects."""
 
-    def __init__(self, workspace_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        workspace_path: Path | None = None,
+        scan_concurrency: int | None = None,
+    ) -> None:
         """Initialize the project service.
 
         Args:
             workspace_path: Optional path to workspace.
                 Defaults to settings.workspace_path.
+            scan_concurrency: Optional max threads for probing projects.
+                Defaults to settings.projects_scan_concurrency.
         """
         self.workspace_path = workspace_path or settings.workspace_path
+        self.scan_concurrency = scan_concurrency or settings.projects_scan_concurrency
+        self._scan_pool: ThreadPoolExecutor | None = None
+        self._workspace_key: Path | None = None
+        self._workspace_resolved: Path | None = None
+        self._neg_cache: OrderedDict[str, float] = OrderedDict()  # id -> miss time
+        # ((workspace, mtime_ns), cached at, projects)
+        self._list_cache: tuple[tuple[str, int], float, list[Project]] | None = None
 
     def list_projects(self) -> list[Project]:
         """List all projects in the workspace.
 
         Scans the workspace directory for git repositories. A directory is
-        considered a project if it contains a .git subdirectory.
+        considered a project if it contains a .git subdirectory. Entries
+        get_project would reject are skipped: repositories whose names are not
+        valid project ids, and symlinks resolving outside the workspace.
+
+        Results are reused while the workspace directory's mtime is unchanged,
+        for at most LIST_CACHE_TTL seconds.
 
         Returns:
             List of Project objects found in the workspace, sorted by name.
         """
-        workspace = Path(self.workspace_path).expanduser()
-        if not workspace.exists():
+        # Scan the resolved workspace so paths match get_project's
+        workspace = str(self._get_resolved_workspace())
+        try:
+            stamp = (workspace, os.stat(workspace).st_mtime_ns)
+        except FileNotFoundError:
             return []
 
+        now = time.monotonic()
+        if self._list_cache is not None:
+            cached_stamp, cached_at, cached = self._list_cache
+            if cached_stamp == stamp and now - cached_at < LIST_CACHE_TTL:
+                return list(cached)
+
+        try:
+            # DirEntry.is_dir() reuses the d_type from readdir, no stat per entry
+            with os.scandir(workspace) as it:
+                entries = []
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    if not entry.is_symlink():
+                        entries.append((entry.name, entry.path))
+                    else:
+                        # Same resolution and containment rule as get_project
+                        path = os.path.realpath(entry.path)
+                        if self._is_path_within_workspace(path, workspace):
+                            entries.append((entry.name, path))
+                        else:
+                            logger.debug(
+                                f"Skipping symlink outside workspace: {entry.name!r}"
+                            )
+        except FileNotFoundError:
+            return []
+
+        entries.sort(key=itemgetter(0))
+        paths = [path for _, path in entries]
+        if self.scan_concurrency > 1 and len(paths) >= PARALLEL_SCAN_THRESHOLD:
+            # scandir releases the GIL, so probes overlap their syscalls
+            probes = self._get_scan_pool().map(self._probe_project, paths)
+        else:
+            probes = map(self._probe_project, paths)
+
+        # Fields come straight from scandir as str/bool, so skip validation
         projects = []
-        for item in workspace.iterdir():
-            if not item.is_dir():
+        for (name, path), (has_git, has_beads) in zip(entries, probes, strict=True):
+            if not has_git:
                 continue
-            if not (item / ".git").exists():
+            if not _VALID_NAME.match(name):
+                logger.warning(f"Skipping repository with invalid project id: {name!r}")
                 continue
 
             projects.append(
-                Project(
-                    id=item.name,
-                    name=item.name,
-                    path=str(item),
-                    has_beads=(item / ".beads").exists(),
+                Project.model_construct(
+                    id=name,
+                    name=name,
+                    path=path,
+                    has_beads=has_beads,
                 )
             )
 
-        return sorted(projects, key=lambda p: p.name)
+        self._list_cache = (stamp, now, projects)
+        return list(projects)
 
     def get_project(self, project_id: str) -> Project | None:
         """Get a specific project by ID.
@@ -65,29 +147,132 @@ class ProjectService:
             Validates that the resolved path stays within workspace_path
             to prevent path traversal attacks.
         """
-        workspace = Path(self.workspace_path).expanduser().resolve()
-        project_path = (workspace / project_id).resolve()
+        # Reject anything that isn't a plain directory name before touching disk
+        if not _VALID_NAME.match(project_id):
+            logger.warning(f"Invalid project id rejected: {project_id}")
+            return None
+
+        workspace = str(self._get_resolved_workspace())
+        now = time.monotonic()
+        missed_at = self._neg_cache.get(project_id)
+        if missed_at is not None and now - missed_at < NEGATIVE_CACHE_TTL:
+            return None
+
+        # The id is a single validated component, so the join is already
+        # normalized; only paths through a symlink need a real resolve
+        project_path = os.path.join(workspace, project_id)
+        if self._has_symlink(project_path, workspace):
+            project_path = os.path.realpath(project_path)
 
         # Security: Validate path traversal - ensure resolved path is within workspace
         if not self._is_path_within_workspace(project_path, workspace):
             logger.warning(f"Path traversal attempt detected: {project_id}")
+            self._remember_miss(project_id, now)
             return None
 
-        if not project_path.exists() or not project_path.is_dir():
-            return None
-        if not (project_path / ".git").exists():
+        has_git, has_beads = self._probe_project(project_path)
+        if not has_git:
+            self._remember_miss(project_id, now)
             return None
 
-        return Project(
+        return Project.model_construct(
             id=project_id,
             name=project_id,
-            path=str(project_path),
-            has_beads=(project_path / ".beads").exists(),
+            path=project_path,
+            has_beads=has_beads,
         )
 
-    def _is_path_within_workspace(self, path: Path, workspace: Path) -> bool:
+    @staticmethod
+    def _has_symlink(path: str, workspace: str) -> bool:
+        """Check whether any component of path below workspace is a symlink.
+
+        Args:
+            path: Normalized absolute path inside workspace.
+            workspace: The resolved workspace directory.
+
+        Returns:
+            True if a symlink sits between workspace and path, False otherwise.
+        """
+        while len(path) > len(workspace):
+            if os.path.islink(path):
+                return True
+            path = os.path.dirname(path)
+        return False
+
+    @staticmethod
+    def _probe_project(path: str) -> tuple[bool, bool]:
+        """Detect .git and .beads in a project directory with one listing.
+
+        Args:
+            path: Path to the candidate project directory.
+
+        Returns:
+            Tuple of (has_git, has_beads). Both False if path is not a
+            readable directory.
+        """
+        try:
+            with os.scandir(path) as it:
+                names = {entry.name for entry in it}
+        except (OSError, ValueError):
+            return False, False
+        return ".git" in names, ".beads" in names
+
+    def close(self) -> None:
+        """Shut down the probe thread pool, if one was started.
+
+        The service stays usable; a later parallel scan starts a new pool.
+        """
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=True)
+            self._scan_pool = None
+
+    def _get_scan_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for probing, creating it on first use.
+
+        Returns:
+            Executor shared by all list_projects calls on this service.
+        """
+        if self._scan_pool is None:
+            self._scan_pool = ThreadPoolExecutor(
+                max_workers=self.scan_concurrency,
+                thread_name_prefix="project-scan",
+            )
+        return self._scan_pool
+
+    def _get_resolved_workspace(self) -> Path:
+        """Get the resolved workspace path, resolving only when it changes.
+
+        Returns:
+            Absolute workspace path with symlinks resolved.
+        """
+        if (
+            self._workspace_resolved is None
+            or self._workspace_key != self.workspace_path
+        ):
+            self._workspace_key = self.workspace_path
+            self._workspace_resolved = Path(self.workspace_path).expanduser().resolve()
+            self._neg_cache.clear()
+        return self._workspace_resolved
+
+    def _remember_miss(self, project_id: str, now: float) -> None:
+        """Record a get_project miss, evicting the oldest past the size limit.
+
+        Args:
+            project_id: The project identifier that was not found.
+            now: Monotonic timestamp of the lookup.
+        """
+        self._neg_cache[project_id] = now
+        self._neg_cache.move_to_end(project_id)
+        if len(self._neg_cache) > NEGATIVE_CACHE_SIZE:
+            self._neg_cache.popitem(last=False)
+
+    def _is_path_within_workspace(
+        self, path: str | Path, workspace: str | Path
+    ) -> bool:
         """Check if a path is within the workspace directory.
 
+        Pure string comparison; callers must pass normalized absolute paths.
+
         Args:
             path: The path to check (should be resolved/absolute).
             workspace: The workspace directory (should be resolved/absolute).
@@ -95,11 +280,8 @@ class ProjectService:
         Returns:
             True if path is within workspace, False otherwise.
         """
-        try:
-            path.relative_to(workspace)
-            return True
-        except ValueError:
-            return False
+        path, workspace = os.fspath(path), os.fspath(workspace)
+        return path == workspace or path.startswith(workspace.rstrip(os.sep) + os.sep)
 
     def check_beads_initialized(self, project_path: Path) -> bool:
         """Check if a project has beads initialized.
@@ -110,5 +292,5 @@ class ProjectService:
         Returns:
             True if beads is initialized (.beads directory exists), False otherwise.
         """
-        path = Path(project_path)
-        return (path / ".beads").exists()
+        # Existence only: faccessat(F_OK) skips filling a stat buffer
+        return os.access(os.path.join(project_path, ".beads"), os.F_OK)
@@ -1,10 +1,73 @@
 """Shared test fixtures for Claude Dev Container backend."""
 
+import docker
 import pytest
+from docker.utils import kwargs_from_env
 from fastapi.testclient import TestClient
 
 from app.main import app
 
+# Timeout (seconds) for the one-off Docker daemon ping at collection time
+DOCKER_PING_TIMEOUT = 0.5
+
+_docker_available_key = pytest.StashKey[bool]()
+
+
+def _ping_docker() -> bool:
+    """Check if the Docker daemon answers within DOCKER_PING_TIMEOUT."""
+    try:
+        api = docker.APIClient(timeout=DOCKER_PING_TIMEOUT, **kwargs_from_env())
+    except Exception:
+        return False
+    try:
+        return bool(api.ping())
+    except Exception:
+        return False
+    finally:
+        api.close()
+
+
+def is_docker_available(config: pytest.Config) -> bool:
+    """Return whether Docker is available, pinging at most once per session."""
+    if _docker_available_key not in config.stash:
+        config.stash[_docker_available_key] = _ping_docker()
+    return config.stash[_docker_available_key]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip Docker tests when the daemon is unavailable (and vice versa).
+
+    Runs after -m deselection, so `-m "not docker"` never pings the daemon.
+    """
+    docker_items = [
+        item
+        for item in items
+        if item.get_closest_marker("docker") or item.get_closest_marker("no_docker")
+    ]
+    if not docker_items:
+        return
+
+    available = is_docker_available(config)
+    skip_docker = pytest.mark.skip(reason="Docker daemon not available")
+    skip_no_docker = pytest.mark.skip(
+        reason="Test only runs when Docker is not available"
+    )
+    for item in docker_items:
+        if item.get_closest_marker("no_docker"):
+            if available:
+                item.add_marker(skip_no_docker)
+        elif not available:
+            item.add_marker(skip_docker)
+
+
+@pytest.fixture(scope="session")
+def docker_available(pytestconfig: pytest.Config) -> bool:
+    """Whether the Docker daemon is reachable."""
+    return is_docker_available(pytestconfig)
+
 
 @pytest.fixture
 def client() -> TestClient:
@@ -0,0 +1,26 @@
+"""Subprocess result helpers for testing."""
+
+import subprocess
+
+
+def create_completed_process(
+    stdout: str = "",
+    returncode: int = 0,
+    stderr: str = "",
+) -> subprocess.CompletedProcess[str]:
+    """Create a CompletedProcess to use as a mocked subprocess.run result.
+
+    A real CompletedProcess is much cheaper to build than a Mock and only
+    exposes the attributes production code actually reads.
+
+    Args:
+        stdout: Captured stdout to return
+        returncode: Exit code to return
+        stderr: Captured stderr to return
+
+    Returns:
+        CompletedProcess with the given fields
+    """
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout, stderr=stderr
+    )
@@ -177,3 +177,15 @@ class TestProjectsAPI:
         with patch("app.main.project_service.workspace_path", mock_workspace):
             response = client.get("/api/projects/project-with-beads/../../../etc")
             assert response.status_code == 404
+
+    # =========================================================================
+    # Application lifespan
+    # =========================================================================
+
+    def test_shutdown_closes_project_service(self) -> None:
+        """Application shutdown releases the project scan pool."""
+        with patch("app.main.project_service.close") as mock_close:
+            with TestClient(app):
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once_with()
@@ -1,9 +1,12 @@
 """Integration tests for rate limiting."""
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
-from app.main import app, limiter
+from app.main import EXEC_RATE_LIMIT, app, limiter
 
 
 class TestRateLimiting:
@@ -17,12 +20,14 @@ class TestRateLimiting:
         yield
         limiter.reset()
 
-    def test_rate_limit_health_endpoint_not_limited(self, client: TestClient) -> None:
+    async def test_rate_limit_health_endpoint_not_limited(self) -> None:
         """Health endpoint should not be rate limited."""
-        # Make many requests to health endpoint
-        for _ in range(100):
-            response = client.get("/health")
-            assert response.status_code == 200
+        # Fire a concurrent burst of requests at the health endpoint
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(*(ac.get("/health") for _ in range(100)))
+
+        assert all(r.status_code == 200 for r in responses)
 
     def test_rate_limiter_is_configured(self) -> None:
         """Verify rate limiter is properly configured in app state."""
@@ -30,27 +35,31 @@ class TestRateLimiting:
         assert app.state.limiter is not None
         assert app.state.limiter == limiter
 
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
+            "/api/projects/fake-project/work/fake-bead",
+            "/api/projects/fake-project/review",
+            "/api/projects/fake-project/push-pr",
+        ],
+    )
     def test_rate_limited_endpoint_returns_429_when_exhausted(
-        self, client: TestClient
+        self, client: TestClient, endpoint: str
     ) -> None:
-        """Verify rate limited endpoint returns 429 when limit is exceeded.
+        """Verify rate limited endpoint returns 429 once its limit is exceeded.
 
-        The work endpoint has a limit of 10/minute, so we should get 429
-        after 10 requests.
+        The limit is the EXEC_RATE_LIMIT constant the endpoints are declared
+        with rather than a hardcoded number. Using a non-existent project
+        returns 404, but rate limiting still applies before the endpoint
+        logic runs.
         """
-        # Make requests until we hit the rate limit
-        # work_on_bead has 10/minute limit, but requires valid project
-        # Using a non-existent project which will return 404, but rate limiting
-        # still applies before the endpoint logic runs
+        limit = EXEC_RATE_LIMIT
 
-        for i in range(12):
-            response = client.post("/api/projects/fake-project/work/fake-bead")
+        for i in range(1, limit + 2):
+            response = client.post(endpoint)
             if response.status_code == 429:
-                # Rate limit hit as expected
-                return
-
-        # If we got here, verify at least one request was limited
-        # (in case test client handles it differently)
-        # The fact that health endpoint worked 100 times above
-        # while this could potentially be limited proves the system works
-        pass
+                break
+        else:
+            pytest.fail(f"{endpoint} was not rate limited after {limit} requests")
+
+        assert i == limit + 1
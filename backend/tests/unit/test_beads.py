@@ -1,27 +1,34 @@
 """Unit tests for beads CLI wrapper service."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from app.models import Bead, BeadStatus, BeadType
 from app.services.beads import BeadsService
+from tests.fixtures.mock_subprocess import create_completed_process
 
 
 class TestBeadsService:
     """Tests for BeadsService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def service(self) -> BeadsService:
-        """Create BeadsService instance with test project path."""
+        """Create one BeadsService with test project path for the class."""
         return BeadsService(project_path="/test/project")
 
-    @pytest.fixture
-    def mock_subprocess(self):
-        """Mock subprocess.run for bd commands."""
+    @pytest.fixture(scope="class", autouse=True)
+    def subprocess_patch(self):
+        """Patch subprocess.run once for the whole class."""
         with patch("app.services.beads.subprocess.run") as mock:
             yield mock
 
+    @pytest.fixture(autouse=True)
+    def mock_subprocess(self, subprocess_patch: Mock) -> Mock:
+        """Mock subprocess.run for bd commands, reset for each test."""
+        subprocess_patch.reset_mock(return_value=True, side_effect=True)
+        return subprocess_patch
+
     # ==========================================================================
     # Test _run_bd_command
     # ==========================================================================
@@ -36,12 +43,13 @@ class TestBeadsService:
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Running bd command calls subprocess with correct arguments."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process()
 
         service._run_bd_command(["list", "--status", "open"])
 
         mock_subprocess.assert_called_once_with(
             ["bd", "list", "--status", "open"],
+            executable=ANY,
             cwd="/test/project",
             capture_output=True,
             text=True,
@@ -52,18 +60,84 @@ class TestBeadsService:
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Running bd command with custom timeout uses that timeout."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process()
 
         service._run_bd_command(["list"], timeout=60)
 
         mock_subprocess.assert_called_once_with(
             ["bd", "list"],
+            executable=ANY,
             cwd="/test/project",
             capture_output=True,
             text=True,
             timeout=60,
         )
 
+    def test_run_bd_command_logs_stderr_on_failure(
+        self,
+        service: BeadsService,
+        mock_subprocess: Mock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failing bd command logs its stderr with the warning."""
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Error: no beads database found\n"
+        )
+
+        service._run_bd_command(["list"])
+
+        assert "no beads database found" in caplog.text
+        assert "exit code 1" in caplog.text
+
+    def test_run_bd_command_resolves_executable_once(
+        self, service: BeadsService, mock_subprocess: Mock, monkeypatch
+    ) -> None:
+        """Running bd commands looks up the bd executable only once."""
+        monkeypatch.setattr("app.services.beads._bd_executable", None)
+        mock_subprocess.return_value = create_completed_process()
+
+        with patch(
+            "app.services.beads.shutil.which", return_value="/opt/bin/bd"
+        ) as mock_which:
+            service._run_bd_command(["list"])
+            service._run_bd_command(["ready"])
+
+        mock_which.assert_called_once_with("bd")
+        assert mock_subprocess.call_args[1]["executable"] == "/opt/bin/bd"
+        assert mock_subprocess.call_args[0][0] == ["bd", "ready"]
+
+    def test_run_bd_command_retries_after_stale_executable(
+        self, service: BeadsService, mock_subprocess: Mock, monkeypatch
+    ) -> None:
+        """A stale cached bd path is re-resolved and the command retried once."""
+        monkeypatch.setattr("app.services.beads._bd_executable", "/old/bin/bd")
+        mock_subprocess.side_effect = [
+            FileNotFoundError("/old/bin/bd"),
+            create_completed_process(stdout="ok"),
+        ]
+
+        with patch("app.services.beads.shutil.which", return_value="/new/bin/bd"):
+            result = service._run_bd_command(["list"])
+
+        assert result.stdout == "ok"
+        assert mock_subprocess.call_count == 2
+        assert mock_subprocess.call_args[1]["executable"] == "/new/bin/bd"
+
+    def test_run_bd_command_stale_executable_retry_fails(
+        self, service: BeadsService, mock_subprocess: Mock, monkeypatch
+    ) -> None:
+        """If the retry fails too, the error surfaces as RuntimeError."""
+        monkeypatch.setattr("app.services.beads._bd_executable", "/old/bin/bd")
+        mock_subprocess.side_effect = FileNotFoundError("bd")
+
+        with (
+            patch("app.services.beads.shutil.which", return_value=None),
+            pytest.raises(RuntimeError, match="Failed to execute bd command"),
+        ):
+            service._run_bd_command(["list"])
+
+        assert mock_subprocess.call_count == 2
+
     def test_run_bd_command_timeout_raises_runtime_error(
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
@@ -85,26 +159,26 @@ class TestBeadsService:
             service._run_bd_command(["list"])
 
     # ==========================================================================
-    # Test _parse_bd_list_output
+    # Test _parse_bd_list_output_to_beads
     # ==========================================================================
 
     def test_parse_bd_list_output_empty(self, service: BeadsService) -> None:
         """Parsing empty output returns empty list."""
-        result = service._parse_bd_list_output("")
+        result = service._parse_bd_list_output_to_beads("")
         assert result == []
 
     def test_parse_bd_list_output_single_bead(self, service: BeadsService) -> None:
         """Parsing single bead output returns list with one item."""
         output = "proj-abc [P1] [task] open - Implement feature X"
 
-        result = service._parse_bd_list_output(output)
+        result = service._parse_bd_list_output_to_beads(output)
 
         assert len(result) == 1
-        assert result[0]["id"] == "proj-abc"
-        assert result[0]["title"] == "Implement feature X"
-        assert result[0]["status"] == "open"
-        assert result[0]["priority"] == 1
-        assert result[0]["type"] == "task"
+        assert result[0].id == "proj-abc"
+        assert result[0].title == "Implement feature X"
+        assert result[0].status == BeadStatus.open
+        assert result[0].priority == 1
+        assert result[0].type == BeadType.task
 
     def test_parse_bd_list_output_multiple_beads(self, service: BeadsService) -> None:
         """Parsing multiple beads output returns all items."""
@@ -112,14 +186,14 @@ class TestBeadsService:
 proj-002 [P2] [bug] in_progress - Fix something
 proj-003 [P0] [feature] open - New feature"""
 
-        result = service._parse_bd_list_output(output)
+        result = service._parse_bd_list_output_to_beads(output)
 
         assert len(result) == 3
-        assert result[0]["id"] == "proj-001"
-        assert result[1]["id"] == "proj-002"
-        assert result[2]["id"] == "proj-003"
-        assert result[1]["status"] == "in_progress"
-        assert result[2]["priority"] == 0
+        assert result[0].id == "proj-001"
+        assert result[1].id == "proj-002"
+        assert result[2].id == "proj-003"
+        assert result[1].status == BeadStatus.in_progress
+        assert result[2].priority == 0
 
     def test_parse_bd_list_output_ignores_invalid_lines(
         self, service: BeadsService
@@ -130,10 +204,10 @@ proj-abc [P1] [task] open - Valid bead
 Invalid line here
 Another invalid line"""
 
-        result = service._parse_bd_list_output(output)
+        result = service._parse_bd_list_output_to_beads(output)
 
         assert len(result) == 1
-        assert result[0]["id"] == "proj-abc"
+        assert result[0].id == "proj-abc"
 
     def test_parse_bd_list_output_handles_whitespace(
         self, service: BeadsService
@@ -144,11 +218,26 @@ Another invalid line"""
 
 """
 
-        result = service._parse_bd_list_output(output)
+        result = service._parse_bd_list_output_to_beads(output)
 
         assert len(result) == 1
-        assert result[0]["id"] == "proj-abc"
-        assert result[0]["title"] == "Bead with whitespace"
+        assert result[0].id == "proj-abc"
+        assert result[0].title == "Bead with whitespace"
+
+    def test_parse_bd_list_output_unmapped_values(self, service: BeadsService) -> None:
+        """Parsing maps known values and falls back for unknown ones."""
+        output = """proj-001 [P1] [task] open - First task
+proj-002 [P2] [bug] in_progress - Fix something
+Some header text
+proj-003 [P0] [weird] unknown - Unmapped values"""
+
+        result = service._parse_bd_list_output_to_beads(output)
+
+        assert [b.id for b in result] == ["proj-001", "proj-002", "proj-003"]
+        assert result[1].status == BeadStatus.in_progress
+        assert result[1].type == BeadType.bug
+        assert result[2].status == BeadStatus.open
+        assert result[2].type == BeadType.task
 
     # ==========================================================================
     # Test _parse_bd_show_output
@@ -251,32 +340,38 @@ Type: task"""
 
         assert result.description == "A description"
 
-    def test_dict_to_bead_status_mapping(self, service: BeadsService) -> None:
-        """Converting dict maps status strings to enums."""
-        statuses = [
+    @pytest.mark.parametrize(
+        "status_str,expected_enum",
+        [
             ("open", BeadStatus.open),
             ("in_progress", BeadStatus.in_progress),
             ("closed", BeadStatus.closed),
-        ]
-
-        for status_str, expected_enum in statuses:
-            data = {"id": "x", "title": "x", "status": status_str}
-            result = service._dict_to_bead(data)
-            assert result.status == expected_enum
+        ],
+    )
+    def test_dict_to_bead_status_mapping(
+        self, service: BeadsService, status_str: str, expected_enum: BeadStatus
+    ) -> None:
+        """Converting dict maps status strings to enums."""
+        data = {"id": "x", "title": "x", "status": status_str}
+        result = service._dict_to_bead(data)
+        assert result.status == expected_enum
 
-    def test_dict_to_bead_type_mapping(self, service: BeadsService) -> None:
-        """Converting dict maps type strings to enums."""
-        types = [
+    @pytest.mark.parametrize(
+        "type_str,expected_enum",
+        [
             ("task", BeadType.task),
             ("bug", BeadType.bug),
             ("feature", BeadType.feature),
             ("epic", BeadType.epic),
-        ]
-
-        for type_str, expected_enum in types:
-            data = {"id": "x", "title": "x", "status": "open", "type": type_str}
-            result = service._dict_to_bead(data)
-            assert result.type == expected_enum
+        ],
+    )
+    def test_dict_to_bead_type_mapping(
+        self, service: BeadsService, type_str: str, expected_enum: BeadType
+    ) -> None:
+        """Converting dict maps type strings to enums."""
+        data = {"id": "x", "title": "x", "status": "open", "type": type_str}
+        result = service._dict_to_bead(data)
+        assert result.type == expected_enum
 
     def test_dict_to_bead_defaults(self, service: BeadsService) -> None:
         """Converting minimal dict uses defaults."""
@@ -297,13 +392,11 @@ Type: task"""
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Listing beads returns parsed Bead objects."""
-        mock_subprocess.return_value = Mock(
-            returncode=0,
+        mock_subprocess.return_value = create_completed_process(
             stdout=(
                 "proj-001 [P1] [task] open - Task one\n"
                 "proj-002 [P2] [bug] in_progress - Bug fix"
             ),
-            stderr="",
         )
 
         result = service.list_beads()
@@ -317,7 +410,7 @@ Type: task"""
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Listing beads with status filter passes it to command."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process()
 
         service.list_beads(status="in_progress")
 
@@ -330,12 +423,26 @@ Type: task"""
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Listing beads returns empty list on command failure."""
-        mock_subprocess.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Error"
+        )
 
         result = service.list_beads()
 
         assert result == []
 
+    def test_list_beads_empty_output_skips_parse(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Listing beads with blank output returns [] without parsing."""
+        mock_subprocess.return_value = create_completed_process(stdout="\n  \n")
+
+        with patch.object(BeadsService, "_parse_bd_list_output_to_beads") as mock_parse:
+            result = service.list_beads()
+
+        assert result == []
+        mock_parse.assert_not_called()
+
     # ==========================================================================
     # Test get_bead
     # ==========================================================================
@@ -344,13 +451,11 @@ Type: task"""
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting a bead returns parsed Bead object."""
-        mock_subprocess.return_value = Mock(
-            returncode=0,
+        mock_subprocess.return_value = create_completed_process(
             stdout="""proj-abc: Test bead
 Status: open
 Priority: P1
 Type: task""",
-            stderr="",
         )
 
         result = service.get_bead("proj-abc")
@@ -364,8 +469,8 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting nonexistent bead returns None."""
-        mock_subprocess.return_value = Mock(
-            returncode=1, stdout="", stderr="Bead not found"
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Bead not found"
         )
 
         result = service.get_bead("nonexistent")
@@ -376,7 +481,7 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting a bead calls bd show with bead ID."""
-        mock_subprocess.return_value = Mock(returncode=1, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process(returncode=1)
 
         service.get_bead("proj-xyz")
 
@@ -384,6 +489,133 @@ Type: task""",
         args = mock_subprocess.call_args[0][0]
         assert args == ["bd", "show", "proj-xyz"]
 
+    # ==========================================================================
+    # Test get_beads
+    # ==========================================================================
+
+    def test_get_beads_indexes_results_by_id(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Getting several beads returns them keyed by ID."""
+        mock_subprocess.return_value = create_completed_process(
+            stdout="""[
+  {"id": "proj-002", "title": "Second", "status": "in_progress",
+   "priority": 1, "issue_type": "bug"},
+  {"id": "proj-001", "title": "First", "status": "open",
+   "priority": 2, "issue_type": "task", "description": "Details"}
+]""",
+        )
+
+        result = service.get_beads(["proj-001", "proj-002"])
+
+        assert list(result) == ["proj-001", "proj-002"]
+        assert result["proj-001"] is not None
+        assert result["proj-001"].title == "First"
+        assert result["proj-001"].description == "Details"
+        assert result["proj-002"] is not None
+        assert result["proj-002"].status == BeadStatus.in_progress
+        assert result["proj-002"].type == BeadType.bug
+
+    def test_get_beads_calls_show_once(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Getting several beads runs a single bd show --json command."""
+        mock_subprocess.return_value = create_completed_process(stdout="[]")
+
+        service.get_beads(["proj-001", "proj-002", "proj-003"])
+
+        mock_subprocess.assert_called_once()
+        args = mock_subprocess.call_args[0][0]
+        assert args == ["bd", "show", "--json", "proj-001", "proj-002", "proj-003"]
+
+    def test_get_beads_missing_ids_are_none(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """IDs absent from the bd output map to None."""
+        mock_subprocess.return_value = create_completed_process(
+            stdout='{"id": "proj-001", "title": "Only one", "status": "open"}',
+        )
+
+        result = service.get_beads(["proj-001", "proj-missing"])
+
+        assert result["proj-001"] is not None
+        assert result["proj-missing"] is None
+
+    def test_get_beads_failure_returns_all_none(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Getting beads maps every ID to None on command failure."""
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Error"
+        )
+
+        result = service.get_beads(["proj-001", "proj-002"])
+
+        assert result == {"proj-001": None, "proj-002": None}
+
+    @pytest.mark.parametrize("stdout", ["null", "5", '"proj-001"'])
+    def test_get_beads_non_record_json_returns_all_none(
+        self, service: BeadsService, mock_subprocess: Mock, stdout: str
+    ) -> None:
+        """Valid JSON that holds no records maps every ID to None."""
+        mock_subprocess.return_value = create_completed_process(stdout=stdout)
+
+        result = service.get_beads(["proj-001"])
+
+        assert result == {"proj-001": None}
+
+    def test_get_beads_null_fields_use_defaults(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Null fields in a record fall back to the same defaults as missing ones."""
+        mock_subprocess.return_value = create_completed_process(
+            stdout="""[
+  {"id": "proj-001", "title": null, "status": null, "priority": null,
+   "issue_type": null, "description": null},
+  {"id": "proj-002", "title": "Top", "priority": 0}
+]""",
+        )
+
+        result = service.get_beads(["proj-001", "proj-002"])
+
+        assert result["proj-001"] == Bead(
+            id="proj-001",
+            title="",
+            status=BeadStatus.open,
+            description="",
+            priority=2,
+            type=BeadType.task,
+        )
+        assert result["proj-002"] is not None
+        assert result["proj-002"].priority == 0
+
+    def test_get_beads_skips_malformed_records(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Records with unusable ids or field types are treated as not found."""
+        mock_subprocess.return_value = create_completed_process(
+            stdout="""[
+  {"id": ["proj-001"], "title": "Unhashable id"},
+  {"id": "proj-002", "title": "Bad priority", "priority": "high"},
+  {"id": "proj-003", "title": "Fine"}
+]""",
+        )
+
+        result = service.get_beads(["proj-001", "proj-002", "proj-003"])
+
+        assert result["proj-001"] is None
+        assert result["proj-002"] is None
+        assert result["proj-003"] is not None
+
+    def test_get_beads_empty_ids_skips_command(
+        self, service: BeadsService, mock_subprocess: Mock
+    ) -> None:
+        """Getting no beads does not run bd at all."""
+        result = service.get_beads([])
+
+        assert result == {}
+        mock_subprocess.assert_not_called()
+
     # ==========================================================================
     # Test get_ready_beads
     # ==========================================================================
@@ -392,10 +624,8 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting ready beads returns parsed Bead objects."""
-        mock_subprocess.return_value = Mock(
-            returncode=0,
-            stdout="proj-001 [P1] [task] open - Ready task",
-            stderr="",
+        mock_subprocess.return_value = create_completed_process(
+            stdout="proj-001 [P1] [task] open - Ready task"
         )
 
         result = service.get_ready_beads()
@@ -407,7 +637,7 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting ready beads calls bd ready."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process()
 
         service.get_ready_beads()
 
@@ -419,7 +649,9 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Getting ready beads returns empty on failure."""
-        mock_subprocess.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Error"
+        )
 
         result = service.get_ready_beads()
 
@@ -433,7 +665,7 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Updating bead status returns True on success."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="Updated", stderr="")
+        mock_subprocess.return_value = create_completed_process(stdout="Updated")
 
         result = service.update_bead_status("proj-abc", "in_progress")
 
@@ -443,7 +675,9 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Updating bead status returns False on failure."""
-        mock_subprocess.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        mock_subprocess.return_value = create_completed_process(
+            returncode=1, stderr="Error"
+        )
 
         result = service.update_bead_status("proj-abc", "in_progress")
 
@@ -453,7 +687,7 @@ Type: task""",
         self, service: BeadsService, mock_subprocess: Mock
     ) -> None:
         """Updating bead status calls bd update with correct args."""
-        mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_subprocess.return_value = create_completed_process()
 
         service.update_bead_status("proj-abc", "in_progress")
 
@@ -1,43 +1,192 @@
 """Unit tests for container manager service."""
 
 import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import Mock, patch
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from app.models import CommandResult, ExecutionState
 from app.services.containers import ContainerService
 
+_NAME = "test-project"
+_PATH = "/path/to/project"
+_CLAUDE_MOUNT = ("/usr/local/bin/claude", "ro")
+_20_LINES = "\n".join(f"line{i}" for i in range(20))
+
+# Streamed exec_start chunks per expected execution state
+_EXEC_OUTPUTS = {
+    ExecutionState.completed: (b"test output",),
+    ExecutionState.blocked: (b"BLOCKED: waiting for input",),
+    ExecutionState.cancelled: (b"cancelled",),
+    ExecutionState.failed: (b"error occurred",),
+}
+
+# Never-set event for progress tests; get_progress only reads is_set()
+_NOT_DONE = threading.Event()
+
+
+def _relocate_system_claude(system_claude: Path) -> dict[str, tuple[str, str]]:
+    """Copy the default mount table with /usr/local/bin/claude moved.
+
+    Only the absolute entry is relocated, so the shipped order, binds and
+    modes are still what's tested, independent of the host's own CLI.
+    """
+    return {
+        str(system_claude) if host == _CLAUDE_MOUNT[0] else host: target
+        for host, target in ContainerService.MOUNT_CANDIDATES.items()
+    }
+
+
+class FakeDockerAPI:
+    """Stub of the low-level Docker API calls made by exec_claude.
+
+    Plain methods instead of Mock: no child mocks or call recording for
+    tests that only need canned return values.
+    """
+
+    def __init__(self, chunks: tuple[bytes, ...] = (), exit_code: int = 0) -> None:
+        self.chunks = chunks
+        self.exit_code = exit_code
+
+    def exec_create(self, *args: Any, **kwargs: Any) -> dict[str, str]:
+        return {"Id": "exec123"}
+
+    def exec_start(self, *args: Any, **kwargs: Any) -> Any:
+        # Fresh iterator per call so repeated execs see the same output
+        return iter(self.chunks)
+
+    def exec_inspect(self, *args: Any, **kwargs: Any) -> dict[str, int]:
+        return {"ExitCode": self.exit_code}
+
+
+class FakeClient:
+    """Stub DockerClient exposing only the low-level api attribute."""
+
+    def __init__(self, api: FakeDockerAPI) -> None:
+        self.api = api
+
+
+@dataclass(slots=True)
+class FakeContainer:
+    """Stub Docker container; only the call-asserted methods are mocks."""
+
+    id: str = "abc123456789"
+    status: str = "running"
+    client: FakeClient = field(default_factory=lambda: FakeClient(FakeDockerAPI()))
+    stop: MagicMock = field(default_factory=MagicMock)
+    remove: MagicMock = field(default_factory=MagicMock)
+    exec_run: MagicMock = field(default_factory=MagicMock)
+
+    def reload(self) -> None:
+        pass
+
 
 class TestContainerService:
     """Tests for ContainerService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self) -> ContainerService:
-        """Create ContainerService instance with mocked Docker client."""
+        """Create ContainerService instance shared across the module.
+
+        The Docker client is created lazily, so tests that never request
+        mock_docker_client run without the DockerClient patch.
+        """
         return ContainerService(docker_socket="/var/run/docker.sock")
 
-    @pytest.fixture
-    def mock_docker_client(self):
-        """Create a mock Docker client."""
+    @pytest.fixture(scope="module")
+    def docker_client_class(self):
+        """Patch docker.DockerClient once for the whole module.
+
+        Module rather than session scope so the patch never leaks into the
+        real-Docker integration tests.
+        """
         with patch("app.services.containers.docker.DockerClient") as mock_class:
-            mock_client = Mock()
-            mock_class.return_value = mock_client
-            yield mock_client
+            yield mock_class
 
     @pytest.fixture
-    def mock_container(self):
-        """Create a mock container."""
-        container = Mock()
-        container.id = "abc123456789"
-        container.status = "running"
-        return container
+    def mock_docker_client(self, docker_client_class: Mock) -> Mock:
+        """Create a fresh mock Docker client returned by the patched class."""
+        docker_client_class.reset_mock(return_value=True, side_effect=True)
+        mock_client = Mock()
+        docker_client_class.return_value = mock_client
+        return mock_client
+
+    @pytest.fixture
+    def mock_container(self) -> FakeContainer:
+        """Create a fresh fake container for each test."""
+        return FakeContainer()
+
+    @pytest.fixture(scope="session")
+    def fake_home(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Home directory with every optional mount source, built once."""
+        home = tmp_path_factory.mktemp("fake_home")
+        (home / ".local" / "bin").mkdir(parents=True)
+        (home / ".local" / "bin" / "claude").touch()
+        (home / ".gitconfig").touch()
+        (home / ".ssh").mkdir()
+        (home / ".claude").mkdir()
+        return home
+
+    @pytest.fixture(scope="session")
+    def system_claude(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Stand-in for /usr/local/bin/claude, built once."""
+        claude = tmp_path_factory.mktemp("system") / "usr" / "local" / "bin" / "claude"
+        claude.parent.mkdir(parents=True)
+        claude.touch()
+        return claude
+
+    @pytest.fixture(scope="session")
+    def empty_home(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Home directory with no optional mount sources."""
+        return tmp_path_factory.mktemp("empty_home")
+
+    @pytest.fixture(scope="module")
+    def shared_tmp(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Temp directory created once for the module's file-based tests."""
+        return tmp_path_factory.mktemp("containers_tests", numbered=False)
+
+    @pytest.fixture
+    def work_dir(self, shared_tmp: Path, request: pytest.FixtureRequest) -> Path:
+        """Per-test subdirectory of shared_tmp, named after the test."""
+        path = shared_tmp / request.node.name
+        path.mkdir()
+        return path
+
+    @pytest.fixture
+    def seeded_service(
+        self, service: ContainerService, mock_container: FakeContainer
+    ) -> ContainerService:
+        """Service with mock_container already registered for test-project.
+
+        Skips the ensure_container path (Docker run mock, volume mount
+        probing) for tests that only need a container to exist.
+        """
+        service._containers[_NAME] = mock_container
+        return service
+
+    @pytest.fixture(autouse=True)
+    def _reset_service(self, service: ContainerService) -> None:
+        """Reset the shared service so every test starts clean."""
+        service._client = None
+        service._containers.clear()
+        service._executions.clear()
 
     # =========================================================================
     # Test get_client
     # =========================================================================
 
+    def test_init_does_not_create_client(self, docker_client_class: Mock) -> None:
+        """Constructing the service defers Docker client creation."""
+        docker_client_class.reset_mock()
+
+        service = ContainerService(docker_socket="/var/run/docker.sock")
+
+        docker_client_class.assert_not_called()
+        assert service._client is None
+
     def test_get_client_creates_docker_client(
         self, service: ContainerService, mock_docker_client: Mock
     ) -> None:
@@ -63,12 +212,12 @@ class TestContainerService:
         self,
         service: ContainerService,
         mock_docker_client: Mock,
-        mock_container: Mock,
+        mock_container: FakeContainer,
     ) -> None:
         """Ensuring container creates one when none exists."""
         mock_docker_client.containers.run.return_value = mock_container
 
-        container_id = service.ensure_container("test-project", "/path/to/project")
+        container_id = service.ensure_container(_NAME, _PATH)
 
         assert container_id == mock_container.id
         mock_docker_client.containers.run.assert_called_once()
@@ -77,65 +226,53 @@ class TestContainerService:
         self,
         service: ContainerService,
         mock_docker_client: Mock,
-        mock_container: Mock,
+        mock_container: FakeContainer,
     ) -> None:
         """Ensuring container returns existing if already running."""
         mock_docker_client.containers.run.return_value = mock_container
         mock_container.status = "running"
 
         # First call creates container
-        service.ensure_container("test-project", "/path/to/project")
+        service.ensure_container(_NAME, _PATH)
         # Second call should return existing
-        container_id = service.ensure_container("test-project", "/path/to/project")
+        container_id = service.ensure_container(_NAME, _PATH)
 
         assert container_id == mock_container.id
         # Should only create once
         assert mock_docker_client.containers.run.call_count == 1
 
     def test_ensure_container_recreates_if_stopped(
-        self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        self, service: ContainerService, mock_docker_client: Mock
     ) -> None:
         """Ensuring container recreates if existing is stopped."""
-        mock_docker_client.containers.run.return_value = mock_container
-        mock_container.status = "exited"
+        stopped = FakeContainer(id="abc123", status="exited")
+        replacement = FakeContainer(id="new123", status="running")
+        mock_docker_client.containers.run.side_effect = [stopped, replacement]
 
-        # First call creates container
-        service.ensure_container("test-project", "/path/to/project")
-
-        # Simulate container stopped
-        mock_container.status = "exited"
-        mock_container.reload.return_value = None
-
-        # Create a new container for the second call
-        new_container = Mock()
-        new_container.id = "new123"
-        new_container.status = "running"
-        mock_docker_client.containers.run.return_value = new_container
-
-        container_id = service.ensure_container("test-project", "/path/to/project")
+        # First call creates the (stopped) container, second replaces it
+        service.ensure_container(_NAME, _PATH)
+        container_id = service.ensure_container(_NAME, _PATH)
 
         assert container_id == "new123"
+        assert mock_docker_client.containers.run.call_count == 2
 
     def test_ensure_container_raises_on_empty_path(
         self, service: ContainerService
     ) -> None:
         """Ensuring container raises ValueError for empty path."""
         with pytest.raises(ValueError, match="Project path required"):
-            service.ensure_container("test-project", "")
+            service.ensure_container(_NAME, "")
 
     def test_ensure_container_sets_correct_labels(
         self,
         service: ContainerService,
         mock_docker_client: Mock,
-        mock_container: Mock,
+        mock_container: FakeContainer,
     ) -> None:
         """Ensuring container sets correct Docker labels."""
         mock_docker_client.containers.run.return_value = mock_container
 
-        service.ensure_container("my-project", "/path/to/project")
+        service.ensure_container("my-project", _PATH)
 
         call_kwargs = mock_docker_client.containers.run.call_args[1]
         assert call_kwargs["labels"]["claude-dev"] == "true"
@@ -145,16 +282,16 @@ class TestContainerService:
         self,
         service: ContainerService,
         mock_docker_client: Mock,
-        mock_container: Mock,
+        mock_container: FakeContainer,
     ) -> None:
         """Ensuring container mounts project path to /workspace."""
         mock_docker_client.containers.run.return_value = mock_container
 
-        service.ensure_container("test-project", "/path/to/project")
+        service.ensure_container(_NAME, _PATH)
 
         call_kwargs = mock_docker_client.containers.run.call_args[1]
-        assert "/path/to/project" in call_kwargs["volumes"]
-        assert call_kwargs["volumes"]["/path/to/project"]["bind"] == "/workspace"
+        assert _PATH in call_kwargs["volumes"]
+        assert call_kwargs["volumes"][_PATH]["bind"] == "/workspace"
 
     # =========================================================================
     # Test _get_volume_mounts
@@ -164,296 +301,246 @@ class TestContainerService:
         self, service: ContainerService
     ) -> None:
         """Volume mounts include project workspace."""
-        volumes = service._get_volume_mounts("/path/to/project")
+        volumes = service._get_volume_mounts(_PATH)
 
-        assert "/path/to/project" in volumes
-        assert volumes["/path/to/project"]["bind"] == "/workspace"
-        assert volumes["/path/to/project"]["mode"] == "rw"
+        assert _PATH in volumes
+        assert volumes[_PATH]["bind"] == "/workspace"
+        assert volumes[_PATH]["mode"] == "rw"
 
     def test_get_volume_mounts_includes_claude_cli_if_exists(
-        self, service: ContainerService, tmp_path: Path
+        self, system_claude: Path
     ) -> None:
         """Volume mounts include Claude CLI if it exists."""
-        with patch.object(Path, "exists", return_value=True):
-            volumes = service._get_volume_mounts("/path/to/project")
+        service = ContainerService(mount_candidates={str(system_claude): _CLAUDE_MOUNT})
+
+        volumes = service._get_volume_mounts(_PATH)
 
-        # Check if claude binary would be mounted (when it exists)
-        claude_path = "/usr/local/bin/claude"
-        if claude_path in volumes:
-            assert volumes[claude_path]["mode"] == "ro"
+        assert volumes[str(system_claude)] == {
+            "bind": "/usr/local/bin/claude",
+            "mode": "ro",
+        }
 
     def test_get_volume_mounts_finds_claude_in_local_bin(
-        self, service: ContainerService, tmp_path: Path
+        self, fake_home: Path, empty_home: Path
     ) -> None:
         """Volume mounts find Claude CLI in ~/.local/bin when not in /usr/local/bin."""
-        # Create ~/.local/bin/claude in tmp_path
-        local_bin_claude = tmp_path / ".local" / "bin" / "claude"
-        local_bin_claude.parent.mkdir(parents=True)
-        local_bin_claude.touch()
+        missing_system_claude = empty_home / "usr" / "local" / "bin" / "claude"
+        local_bin_claude = fake_home / ".local" / "bin" / "claude"
+        service = ContainerService(
+            mount_candidates={
+                str(missing_system_claude): _CLAUDE_MOUNT,
+                str(local_bin_claude): _CLAUDE_MOUNT,
+            }
+        )
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
-            volumes = service._get_volume_mounts("/path/to/project")
+        volumes = service._get_volume_mounts(_PATH)
 
         # Should mount the ~/.local/bin/claude path
         assert str(local_bin_claude) in volumes
         assert volumes[str(local_bin_claude)]["bind"] == "/usr/local/bin/claude"
         assert volumes[str(local_bin_claude)]["mode"] == "ro"
-        # /usr/local/bin/claude should NOT be in volumes (doesn't exist)
-        assert "/usr/local/bin/claude" not in volumes
+        # The system location should NOT be in volumes (doesn't exist)
+        assert str(missing_system_claude) not in volumes
 
     def test_get_volume_mounts_prefers_usr_local_bin_claude(
-        self, service: ContainerService, tmp_path: Path
+        self, fake_home: Path, system_claude: Path
     ) -> None:
         """Volume mounts prefer /usr/local/bin/claude over ~/.local/bin/claude."""
-        # Create ~/.local/bin/claude in tmp_path
-        local_bin_claude = tmp_path / ".local" / "bin" / "claude"
-        local_bin_claude.parent.mkdir(parents=True)
-        local_bin_claude.touch()
-
-        # Mock /usr/local/bin/claude to exist
-        original_exists = Path.exists
-
-        def mock_exists(self):
-            if str(self) == "/usr/local/bin/claude":
-                return True
-            return original_exists(self)
-
-        with patch("pathlib.Path.home", return_value=tmp_path):
-            with patch.object(Path, "exists", mock_exists):
-                volumes = service._get_volume_mounts("/path/to/project")
-
-        # Should mount /usr/local/bin/claude, NOT ~/.local/bin/claude
-        assert "/usr/local/bin/claude" in volumes
-        assert volumes["/usr/local/bin/claude"]["bind"] == "/usr/local/bin/claude"
-        assert volumes["/usr/local/bin/claude"]["mode"] == "ro"
+        local_bin_claude = fake_home / ".local" / "bin" / "claude"
+        service = ContainerService(
+            mount_candidates={
+                str(system_claude): _CLAUDE_MOUNT,
+                str(local_bin_claude): _CLAUDE_MOUNT,
+            }
+        )
+
+        volumes = service._get_volume_mounts(_PATH)
+
+        # Should mount the system location, NOT ~/.local/bin/claude
+        assert str(system_claude) in volumes
+        assert volumes[str(system_claude)]["bind"] == "/usr/local/bin/claude"
+        assert volumes[str(system_claude)]["mode"] == "ro"
         # ~/.local/bin/claude should NOT be mounted
         assert str(local_bin_claude) not in volumes
 
+    def test_get_volume_mounts_default_table_uses_local_bin_claude(
+        self,
+        fake_home: Path,
+        empty_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Default mount table falls back to ~/.local/bin/claude."""
+        missing_system_claude = empty_home / "usr" / "local" / "bin" / "claude"
+        local_bin_claude = fake_home / ".local" / "bin" / "claude"
+        service = ContainerService(
+            mount_candidates=_relocate_system_claude(missing_system_claude)
+        )
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
+
+        volumes = service._get_volume_mounts(_PATH)
+
+        assert volumes[str(local_bin_claude)] == {
+            "bind": "/usr/local/bin/claude",
+            "mode": "ro",
+        }
+        assert str(missing_system_claude) not in volumes
+
+    def test_get_volume_mounts_default_table_prefers_usr_local_bin_claude(
+        self,
+        fake_home: Path,
+        system_claude: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Default mount table prefers /usr/local/bin/claude when present."""
+        local_bin_claude = fake_home / ".local" / "bin" / "claude"
+        service = ContainerService(
+            mount_candidates=_relocate_system_claude(system_claude)
+        )
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
+
+        volumes = service._get_volume_mounts(_PATH)
+
+        assert volumes[str(system_claude)] == {
+            "bind": "/usr/local/bin/claude",
+            "mode": "ro",
+        }
+        assert str(local_bin_claude) not in volumes
+
     def test_get_volume_mounts_includes_claude_config_if_exists(
-        self, service: ContainerService, tmp_path: Path
+        self,
+        service: ContainerService,
+        fake_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Volume mounts include ~/.claude config directory if it exists."""
-        home = Path.home()
-        claude_config = home / ".claude"
+        claude_config = fake_home / ".claude"
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
 
-        with patch.object(Path, "exists", side_effect=lambda: True):
-            volumes = service._get_volume_mounts("/path/to/project")
+        volumes = service._get_volume_mounts(_PATH)
 
-        if str(claude_config) in volumes:
-            assert volumes[str(claude_config)]["bind"] == "/home/claude/.claude"
-            assert volumes[str(claude_config)]["mode"] == "rw"
+        assert volumes[str(claude_config)]["bind"] == "/home/claude/.claude"
+        assert volumes[str(claude_config)]["mode"] == "rw"
 
     def test_get_volume_mounts_includes_gitconfig_if_exists(
-        self, service: ContainerService, tmp_path: Path
+        self,
+        service: ContainerService,
+        fake_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Volume mounts include ~/.gitconfig if it exists."""
-        # Create a mock gitconfig file
-        mock_gitconfig = tmp_path / ".gitconfig"
-        mock_gitconfig.touch()
+        mock_gitconfig = fake_home / ".gitconfig"
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
-            volumes = service._get_volume_mounts("/path/to/project")
+        volumes = service._get_volume_mounts(_PATH)
 
         assert str(mock_gitconfig) in volumes
         assert volumes[str(mock_gitconfig)]["bind"] == "/home/claude/.gitconfig"
         assert volumes[str(mock_gitconfig)]["mode"] == "ro"
 
     def test_get_volume_mounts_includes_ssh_if_exists(
-        self, service: ContainerService, tmp_path: Path
+        self,
+        service: ContainerService,
+        fake_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Volume mounts include ~/.ssh directory if it exists."""
-        # Create a mock .ssh directory
-        mock_ssh = tmp_path / ".ssh"
-        mock_ssh.mkdir()
+        mock_ssh = fake_home / ".ssh"
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
-            volumes = service._get_volume_mounts("/path/to/project")
+        volumes = service._get_volume_mounts(_PATH)
 
         assert str(mock_ssh) in volumes
         assert volumes[str(mock_ssh)]["bind"] == "/home/claude/.ssh"
         assert volumes[str(mock_ssh)]["mode"] == "ro"
 
     def test_get_volume_mounts_skips_missing_optional_mounts(
-        self, service: ContainerService, tmp_path: Path
+        self,
+        service: ContainerService,
+        empty_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Volume mounts skip optional files/directories that don't exist."""
-        # Use empty tmp_path as home - nothing exists
-        with patch("pathlib.Path.home", return_value=tmp_path):
-            volumes = service._get_volume_mounts("/path/to/project")
+        monkeypatch.setattr(Path, "home", lambda: empty_home)
+
+        volumes = service._get_volume_mounts(_PATH)
 
         # Should only have workspace mount
-        assert "/path/to/project" in volumes
+        assert _PATH in volumes
         # Optional mounts should not be present
-        assert str(tmp_path / ".gitconfig") not in volumes
-        assert str(tmp_path / ".ssh") not in volumes
-        assert str(tmp_path / ".claude") not in volumes
+        assert str(empty_home / ".gitconfig") not in volumes
+        assert str(empty_home / ".ssh") not in volumes
+        assert str(empty_home / ".claude") not in volumes
 
     # =========================================================================
     # Test exec_claude
     # =========================================================================
 
-    def test_exec_claude_raises_if_no_container(
-        self, service: ContainerService
-    ) -> None:
-        """Executing Claude raises KeyError if no container exists."""
-        with pytest.raises(KeyError, match="No container"):
-            service.exec_claude("nonexistent", "test prompt")
-
+    @pytest.mark.parametrize(
+        "exit_code,expected_state",
+        [
+            (0, ExecutionState.completed),
+            (1, ExecutionState.blocked),
+            (130, ExecutionState.cancelled),
+            (1, ExecutionState.failed),
+        ],
+        ids=["completed", "blocked", "cancelled", "failed"],
+    )
     def test_exec_claude_returns_execution_result(
         self,
         service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
-    ) -> None:
-        """Executing Claude returns ExecutionResult with output."""
-        # Set up container
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        # Mock exec_create and exec_start
-        mock_container.client = Mock()
-        mock_container.client.api.exec_create.return_value = {"Id": "exec123"}
-        mock_container.client.api.exec_start.return_value = iter([b"test output"])
-        mock_container.client.api.exec_inspect.return_value = {"ExitCode": 0}
-
-        result = service.exec_claude("test-project", "test prompt")
-
-        assert result.output == "test output"
-        assert result.state == ExecutionState.completed
-        assert result.exit_code == 0
-
-    def test_exec_claude_detects_blocked_state(
-        self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        exit_code: int,
+        expected_state: ExecutionState,
     ) -> None:
-        """Executing Claude detects BLOCKED state from output."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        mock_container.client = Mock()
-        mock_container.client.api.exec_create.return_value = {"Id": "exec123"}
-        mock_container.client.api.exec_start.return_value = iter(
-            [b"BLOCKED: waiting for input"]
+        """Executing Claude returns output, exit code and detected state."""
+        chunks = _EXEC_OUTPUTS[expected_state]
+        service._containers[_NAME] = FakeContainer(
+            client=FakeClient(FakeDockerAPI(chunks, exit_code))
         )
-        mock_container.client.api.exec_inspect.return_value = {"ExitCode": 1}
-
-        result = service.exec_claude("test-project", "test prompt")
-
-        assert result.state == ExecutionState.blocked
-
-    def test_exec_claude_detects_cancelled_state(
-        self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
-    ) -> None:
-        """Executing Claude detects cancelled state from SIGINT."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        mock_container.client = Mock()
-        mock_container.client.api.exec_create.return_value = {"Id": "exec123"}
-        mock_container.client.api.exec_start.return_value = iter([b"cancelled"])
-        mock_container.client.api.exec_inspect.return_value = {"ExitCode": 130}
 
-        result = service.exec_claude("test-project", "test prompt")
+        result = service.exec_claude(_NAME, "test prompt")
 
-        assert result.state == ExecutionState.cancelled
-
-    def test_exec_claude_detects_failed_state(
-        self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
-    ) -> None:
-        """Executing Claude detects failed state from non-zero exit."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        mock_container.client = Mock()
-        mock_container.client.api.exec_create.return_value = {"Id": "exec123"}
-        mock_container.client.api.exec_start.return_value = iter([b"error occurred"])
-        mock_container.client.api.exec_inspect.return_value = {"ExitCode": 1}
-
-        result = service.exec_claude("test-project", "test prompt")
-
-        assert result.state == ExecutionState.failed
-
-    # =========================================================================
-    # Test _determine_state
-    # =========================================================================
-
-    def test_determine_state_completed(self, service: ContainerService) -> None:
-        """Exit code 0 results in completed state."""
-        state = service._determine_state(0, "success")
-        assert state == ExecutionState.completed
-
-    def test_determine_state_blocked(self, service: ContainerService) -> None:
-        """Exit code 1 with BLOCKED in output results in blocked state."""
-        state = service._determine_state(1, "BLOCKED: waiting for approval")
-        assert state == ExecutionState.blocked
-
-    def test_determine_state_cancelled(self, service: ContainerService) -> None:
-        """Exit code 130 (SIGINT) results in cancelled state."""
-        state = service._determine_state(130, "interrupted")
-        assert state == ExecutionState.cancelled
-
-    def test_determine_state_failed(self, service: ContainerService) -> None:
-        """Other non-zero exit codes result in failed state."""
-        state = service._determine_state(1, "error without BLOCKED")
-        assert state == ExecutionState.failed
+        assert result.output == b"".join(chunks).decode()
+        assert result.state == expected_state
+        assert result.exit_code == exit_code
 
     # =========================================================================
     # Test get_progress
     # =========================================================================
 
-    def test_get_progress_no_execution(self, service: ContainerService) -> None:
-        """Getting progress with no execution returns empty ProgressInfo."""
-        progress = service.get_progress("nonexistent")
-
-        assert progress.running is False
-        assert progress.output == ""
-        assert progress.bytes == 0
-
     def test_get_progress_returns_current_output(
-        self, service: ContainerService, tmp_path: Path
+        self, service: ContainerService, work_dir: Path
     ) -> None:
         """Getting progress returns current output from file."""
         # Create a mock output file
-        output_file = tmp_path / "output.log"
+        output_file = work_dir / "output.log"
         output_file.write_text("line1\nline2\nline3")
 
         # Set up mock execution
-        done_event = threading.Event()
-        service._executions["test-project"] = {
+        service._executions[_NAME] = {
             "output_file": str(output_file),
-            "done": done_event,
+            "done": _NOT_DONE,
         }
 
-        progress = service.get_progress("test-project")
+        progress = service.get_progress(_NAME)
 
         assert progress.running is True
         assert "line1" in progress.output
         assert progress.bytes > 0
 
     def test_get_progress_returns_recent_lines(
-        self, service: ContainerService, tmp_path: Path
+        self, service: ContainerService, work_dir: Path
     ) -> None:
         """Getting progress returns last 10 lines as recent."""
         # Create output with many lines
-        output_file = tmp_path / "output.log"
-        lines = [f"line{i}" for i in range(20)]
-        output_file.write_text("\n".join(lines))
+        output_file = work_dir / "output.log"
+        output_file.write_text(_20_LINES)
 
-        done_event = threading.Event()
-        service._executions["test-project"] = {
+        service._executions[_NAME] = {
             "output_file": str(output_file),
-            "done": done_event,
+            "done": _NOT_DONE,
         }
 
-        progress = service.get_progress("test-project")
+        progress = service.get_progress(_NAME)
 
         # Recent should contain last 10 lines
         assert "line19" in progress.recent
@@ -464,26 +551,15 @@ class TestContainerService:
     # Test exec_command
     # =========================================================================
 
-    def test_exec_command_raises_if_no_container(
-        self, service: ContainerService
-    ) -> None:
-        """Executing command raises KeyError if no container exists."""
-        with pytest.raises(KeyError, match="No container"):
-            service.exec_command("nonexistent", "ls -la")
-
     def test_exec_command_returns_command_result(
         self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        seeded_service: ContainerService,
+        mock_container: FakeContainer,
     ) -> None:
         """Executing command returns CommandResult with exit_code and output."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
         mock_container.exec_run.return_value = (0, b"command output")
 
-        result = service.exec_command("test-project", "echo hello")
+        result = seeded_service.exec_command(_NAME, "echo hello")
 
         assert isinstance(result, CommandResult)
         assert result.exit_code == 0
@@ -491,18 +567,14 @@ class TestContainerService:
         mock_container.exec_run.assert_called_once()
 
     def test_exec_command_returns_non_zero_exit_code(
-        self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        self, service: ContainerService
     ) -> None:
         """Executing command returns non-zero exit code on failure."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        mock_container.exec_run.return_value = (1, b"error: command failed")
+        service._containers[_NAME] = FakeContainer(
+            exec_run=MagicMock(return_value=(1, b"error: command failed"))
+        )
 
-        result = service.exec_command("test-project", "exit 1")
+        result = service.exec_command(_NAME, "exit 1")
 
         assert isinstance(result, CommandResult)
         assert result.exit_code == 1
@@ -512,24 +584,13 @@ class TestContainerService:
     # Test get_container_id
     # =========================================================================
 
-    def test_get_container_id_returns_none_if_not_exists(
-        self, service: ContainerService
-    ) -> None:
-        """Getting container ID returns None if no container exists."""
-        result = service.get_container_id("nonexistent")
-        assert result is None
-
     def test_get_container_id_returns_id(
         self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        seeded_service: ContainerService,
+        mock_container: FakeContainer,
     ) -> None:
         """Getting container ID returns container ID."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        result = service.get_container_id("test-project")
+        result = seeded_service.get_container_id(_NAME)
 
         assert result == mock_container.id
 
@@ -537,24 +598,13 @@ class TestContainerService:
     # Test stop_container
     # =========================================================================
 
-    def test_stop_container_returns_false_if_not_exists(
-        self, service: ContainerService
-    ) -> None:
-        """Stopping container returns False if no container exists."""
-        result = service.stop_container("nonexistent")
-        assert result is False
-
     def test_stop_container_stops_and_returns_true(
         self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        seeded_service: ContainerService,
+        mock_container: FakeContainer,
     ) -> None:
         """Stopping container calls stop and returns True."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        result = service.stop_container("test-project")
+        result = seeded_service.stop_container(_NAME)
 
         assert result is True
         mock_container.stop.assert_called_once_with(timeout=10)
@@ -563,38 +613,23 @@ class TestContainerService:
     # Test remove_container
     # =========================================================================
 
-    def test_remove_container_returns_false_if_not_exists(
-        self, service: ContainerService
-    ) -> None:
-        """Removing container returns False if no container exists."""
-        result = service.remove_container("nonexistent")
-        assert result is False
-
     def test_remove_container_removes_and_returns_true(
         self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        seeded_service: ContainerService,
+        mock_container: FakeContainer,
     ) -> None:
         """Removing container calls remove and returns True."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        result = service.remove_container("test-project")
+        result = seeded_service.remove_container(_NAME)
 
         assert result is True
         mock_container.remove.assert_called_once_with(force=True)
 
     def test_remove_container_clears_from_cache(
         self,
-        service: ContainerService,
-        mock_docker_client: Mock,
-        mock_container: Mock,
+        seeded_service: ContainerService,
+        mock_container: FakeContainer,
     ) -> None:
         """Removing container clears it from internal cache."""
-        mock_docker_client.containers.run.return_value = mock_container
-        service.ensure_container("test-project", "/path/to/project")
-
-        service.remove_container("test-project")
+        seeded_service.remove_container(_NAME)
 
-        assert service.get_container_id("test-project") is None
+        assert seeded_service.get_container_id(_NAME) is None
@@ -0,0 +1,77 @@
+"""Unit tests for container service paths that never touch Docker.
+
+Kept apart from test_containers.py so these tests collect without the
+mock and patch machinery.
+"""
+
+import pytest
+
+from app.models import ExecutionState
+from app.services.containers import ContainerService
+
+
+@pytest.fixture(scope="module")
+def service() -> ContainerService:
+    """Create a ContainerService with no containers registered."""
+    return ContainerService(docker_socket="/var/run/docker.sock")
+
+
+class TestDetermineState:
+    """Tests for ContainerService._determine_state."""
+
+    @pytest.mark.parametrize(
+        "exit_code,output,expected_state",
+        [
+            (0, "success", ExecutionState.completed),
+            (1, "BLOCKED: waiting for approval", ExecutionState.blocked),
+            (130, "interrupted", ExecutionState.cancelled),
+            (1, "error without BLOCKED", ExecutionState.failed),
+        ],
+        ids=["completed", "blocked", "cancelled", "failed"],
+    )
+    def test_determine_state(
+        self,
+        service: ContainerService,
+        exit_code: int,
+        output: str,
+        expected_state: ExecutionState,
+    ) -> None:
+        """Exit code and BLOCKED marker map to the right execution state."""
+        assert service._determine_state(exit_code, output) == expected_state
+
+
+class TestMissingContainer:
+    """Tests for lookups on a project with no container."""
+
+    @pytest.mark.parametrize(
+        "method,expected",
+        [
+            ("stop_container", False),
+            ("remove_container", False),
+            ("get_container_id", None),
+        ],
+    )
+    def test_missing_container_returns_default(
+        self, service: ContainerService, method: str, expected: bool | None
+    ) -> None:
+        """Lookups for an unknown project return a default instead of raising."""
+        assert getattr(service, method)("nonexistent") is expected
+
+    @pytest.mark.parametrize(
+        "method,arg",
+        [("exec_claude", "test prompt"), ("exec_command", "ls -la")],
+    )
+    def test_missing_container_raises(
+        self, service: ContainerService, method: str, arg: str
+    ) -> None:
+        """Executing in an unknown project raises KeyError."""
+        with pytest.raises(KeyError, match="No container"):
+            getattr(service, method)("nonexistent", arg)
+
+    def test_get_progress_no_execution(self, service: ContainerService) -> None:
+        """Getting progress with no execution returns empty ProgressInfo."""
+        progress = service.get_progress("nonexistent")
+
+        assert progress.running is False
+        assert progress.output == ""
+        assert progress.bytes == 0
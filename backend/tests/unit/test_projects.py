@@ -1,12 +1,33 @@
 """Unit tests for project discovery service."""
 
+import itertools
+import logging
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from app.models import Project
+from app.services import projects
 from app.services.projects import ProjectService
 
+# Unique names for per-test workspace symlinks
+_link_ids = itertools.count()
+
+
+def make_repo(workspace: str | Path, name: str, *, beads: bool = False) -> None:
+    """Create a project directory with .git (and optionally .beads).
+
+    Uses plain os.mkdir; the workspace root must already exist.
+    """
+    project = os.path.join(workspace, name)
+    os.mkdir(project)
+    os.mkdir(os.path.join(project, ".git"))
+    if beads:
+        os.mkdir(os.path.join(project, ".beads"))
+
 
 class TestProjectService:
     """Tests for ProjectService."""
@@ -19,9 +40,11 @@ class TestProjectService:
         return workspace
 
     @pytest.fixture
-    def service(self, workspace: Path) -> ProjectService:
+    def service(self, workspace: Path) -> Iterator[ProjectService]:
         """Create ProjectService instance with test workspace."""
-        return ProjectService(workspace_path=workspace)
+        service = ProjectService(workspace_path=workspace)
+        yield service
+        service.close()
 
     def test_list_projects_empty_workspace(self, service: ProjectService) -> None:
         """Listing projects in empty workspace returns empty list."""
@@ -39,8 +62,8 @@ class TestProjectService:
     ) -> None:
         """Listing projects finds directories with .git subdirectory."""
         # Create two git repos
-        (workspace / "project-a" / ".git").mkdir(parents=True)
-        (workspace / "project-b" / ".git").mkdir(parents=True)
+        make_repo(workspace, "project-a")
+        make_repo(workspace, "project-b")
 
         result = service.list_projects()
 
@@ -53,9 +76,9 @@ class TestProjectService:
     ) -> None:
         """Listing projects ignores directories without .git."""
         # Git repo
-        (workspace / "valid-project" / ".git").mkdir(parents=True)
+        make_repo(workspace, "valid-project")
         # Non-git directory
-        (workspace / "not-a-repo").mkdir()
+        os.mkdir(os.path.join(workspace, "not-a-repo"))
 
         result = service.list_projects()
 
@@ -66,7 +89,7 @@ class TestProjectService:
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Listing projects ignores files in workspace."""
-        (workspace / "project" / ".git").mkdir(parents=True)
+        make_repo(workspace, "project")
         (workspace / "readme.txt").write_text("test")
 
         result = service.list_projects()
@@ -74,15 +97,53 @@ class TestProjectService:
         assert len(result) == 1
         assert result[0].id == "project"
 
+    def test_list_projects_accepts_git_file(
+        self, workspace: Path, service: ProjectService
+    ) -> None:
+        """Listing projects includes worktrees whose .git is a file."""
+        os.mkdir(os.path.join(workspace, "worktree"))
+        (workspace / "worktree" / ".git").write_text("gitdir: /elsewhere\n")
+
+        result = service.list_projects()
+
+        assert [p.id for p in result] == ["worktree"]
+
+    def test_list_projects_skips_invalid_names(
+        self,
+        workspace: Path,
+        service: ProjectService,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Listing projects skips and warns about repos with invalid ids."""
+        make_repo(workspace, "valid")
+        make_repo(workspace, ".hidden")
+        make_repo(workspace, "has space")
+        # Stray entries that aren't repositories are skipped silently
+        (workspace / ".DS_Store").touch()
+        (workspace / "notes v2.txt").touch()
+        os.mkdir(workspace / ".cache")
+
+        with caplog.at_level(logging.DEBUG, logger="app.services.projects"):
+            result = service.list_projects()
+
+        assert [p.id for p in result] == ["valid"]
+        assert sorted(r.getMessage() for r in caplog.records) == [
+            "Skipping repository with invalid project id: '.hidden'",
+            "Skipping repository with invalid project id: 'has space'",
+        ]
+        assert {r.levelno for r in caplog.records} == {logging.WARNING}
+        # Every listed project is reachable, skipped ones are not
+        assert service.get_project("valid") is not None
+        assert service.get_project("has space") is None
+
     def test_list_projects_detects_beads(
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Listing projects correctly detects beads initialization."""
         # Project with beads
-        (workspace / "with-beads" / ".git").mkdir(parents=True)
-        (workspace / "with-beads" / ".beads").mkdir()
+        make_repo(workspace, "with-beads", beads=True)
         # Project without beads
-        (workspace / "no-beads" / ".git").mkdir(parents=True)
+        make_repo(workspace, "no-beads")
 
         result = service.list_projects()
 
@@ -94,27 +155,100 @@ class TestProjectService:
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Listing projects returns sorted by name."""
-        (workspace / "zebra" / ".git").mkdir(parents=True)
-        (workspace / "alpha" / ".git").mkdir(parents=True)
-        (workspace / "middle" / ".git").mkdir(parents=True)
+        make_repo(workspace, "zebra")
+        make_repo(workspace, "alpha")
+        make_repo(workspace, "middle")
 
         result = service.list_projects()
 
         names = [p.name for p in result]
         assert names == ["alpha", "middle", "zebra"]
 
+    @pytest.mark.parametrize("threshold", [0, 1000], ids=["parallel", "serial"])
+    def test_list_projects_parallel_matches_serial(
+        self,
+        workspace: Path,
+        service: ProjectService,
+        threshold: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Thread-pool and serial scans return the same sorted projects."""
+        monkeypatch.setattr(projects, "PARALLEL_SCAN_THRESHOLD", threshold)
+        for i in range(10):
+            make_repo(workspace, f"repo-{i}")
+        os.mkdir(os.path.join(workspace, "not-a-repo"))
+        os.mkdir(os.path.join(workspace, "repo-3", ".beads"))
+
+        result = service.list_projects()
+
+        assert [p.id for p in result] == [f"repo-{i}" for i in range(10)]
+        assert [p.id for p in result if p.has_beads] == ["repo-3"]
+        assert (service._scan_pool is not None) == (threshold == 0)
+
+        service.close()
+        assert service._scan_pool is None
+        assert [p.id for p in service.list_projects()] == [p.id for p in result]
+
+    def test_list_projects_reuses_cache_while_mtime_unchanged(
+        self,
+        workspace: Path,
+        service: ProjectService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Listing again with an unchanged workspace serves the cached scan."""
+        make_repo(workspace, "project")
+        assert service.list_projects()[0].has_beads is False
+
+        # .beads inside a project doesn't touch the workspace mtime
+        os.mkdir(os.path.join(workspace, "project", ".beads"))
+        assert service.list_projects()[0].has_beads is False
+
+        # Past the TTL the scan runs again and sees the change
+        monkeypatch.setattr(projects, "LIST_CACHE_TTL", 0)
+        assert service.list_projects()[0].has_beads is True
+
+    def test_list_projects_rescans_when_mtime_changes(
+        self, workspace: Path, service: ProjectService
+    ) -> None:
+        """Adding a project changes the workspace mtime and forces a rescan."""
+        make_repo(workspace, "first")
+        assert [p.id for p in service.list_projects()] == ["first"]
+
+        make_repo(workspace, "second")
+        # Bump explicitly; two mkdirs can land in the same timestamp tick
+        mtime_ns = os.stat(workspace).st_mtime_ns + 1_000_000
+        os.utime(workspace, ns=(mtime_ns, mtime_ns))
+
+        assert [p.id for p in service.list_projects()] == ["first", "second"]
+
+    def test_list_projects_cache_expires_after_ttl(
+        self,
+        workspace: Path,
+        service: ProjectService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A cached listing is rebuilt once the TTL has passed."""
+        make_repo(workspace, "project")
+        service.list_projects()
+        os.mkdir(os.path.join(workspace, "project", ".beads"))
+
+        later = projects.time.monotonic() + projects.LIST_CACHE_TTL
+        monkeypatch.setattr(projects.time, "monotonic", lambda: later)
+
+        assert service.list_projects()[0].has_beads is True
+
     def test_get_project_returns_project(
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Getting existing project returns Project object."""
-        (workspace / "my-project" / ".git").mkdir(parents=True)
+        make_repo(workspace, "my-project")
 
         result = service.get_project("my-project")
 
         assert result is not None
         assert result.id == "my-project"
         assert result.name == "my-project"
-        assert str(workspace / "my-project") in result.path
+        assert result.path == os.path.join(workspace.resolve(), "my-project")
 
     def test_get_project_nonexistent_returns_none(
         self, service: ProjectService
@@ -127,17 +261,25 @@ class TestProjectService:
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Getting directory without .git returns None."""
-        (workspace / "not-a-repo").mkdir()
+        os.mkdir(os.path.join(workspace, "not-a-repo"))
 
         result = service.get_project("not-a-repo")
         assert result is None
 
+    def test_get_project_file_returns_none(
+        self, workspace: Path, service: ProjectService
+    ) -> None:
+        """Getting a regular file instead of a directory returns None."""
+        (workspace / "notes.txt").write_text("test")
+
+        result = service.get_project("notes.txt")
+        assert result is None
+
     def test_get_project_detects_beads(
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Getting project correctly detects beads."""
-        (workspace / "project" / ".git").mkdir(parents=True)
-        (workspace / "project" / ".beads").mkdir()
+        make_repo(workspace, "project", beads=True)
 
         result = service.get_project("project")
 
@@ -148,7 +290,7 @@ class TestProjectService:
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Getting project without beads sets has_beads to False."""
-        (workspace / "project" / ".git").mkdir(parents=True)
+        make_repo(workspace, "project")
 
         result = service.get_project("project")
 
@@ -159,7 +301,7 @@ class TestProjectService:
         """check_beads_initialized returns True when .beads exists."""
         project = tmp_path / "project"
         project.mkdir()
-        (project / ".beads").mkdir()
+        os.mkdir(os.path.join(project, ".beads"))
 
         service = ProjectService()
         result = service.check_beads_initialized(project)
@@ -180,7 +322,7 @@ class TestProjectService:
         self, workspace: Path, service: ProjectService
     ) -> None:
         """Project objects have correct structure."""
-        (workspace / "test-proj" / ".git").mkdir(parents=True)
+        make_repo(workspace, "test-proj")
 
         result = service.get_project("test-proj")
 
@@ -191,74 +333,241 @@ class TestProjectService:
         assert isinstance(result.path, str)
         assert isinstance(result.has_beads, bool)
 
+    def test_project_model_is_frozen(
+        self, workspace: Path, service: ProjectService
+    ) -> None:
+        """Project objects are immutable so cached listings can be shared."""
+        make_repo(workspace, "test-proj")
+
+        result = service.list_projects()[0]
+
+        with pytest.raises(ValidationError):
+            result.has_beads = True
+
+    # =========================================================================
+    # Negative Cache Tests
+    # =========================================================================
+
+    def test_get_project_caches_miss_within_ttl(
+        self, workspace: Path, service: ProjectService
+    ) -> None:
+        """A recent miss is served from the negative cache."""
+        assert service.get_project("late-project") is None
+
+        make_repo(workspace, "late-project")
+
+        assert service.get_project("late-project") is None
+
+    def test_get_project_miss_expires_after_ttl(
+        self,
+        workspace: Path,
+        service: ProjectService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A cached miss is retried once the TTL has passed."""
+        assert service.get_project("late-project") is None
+        make_repo(workspace, "late-project")
+
+        later = projects.time.monotonic() + projects.NEGATIVE_CACHE_TTL
+        monkeypatch.setattr(projects.time, "monotonic", lambda: later)
+
+        assert service.get_project("late-project") is not None
+
+    def test_negative_cache_evicts_oldest(
+        self, service: ProjectService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The negative cache is bounded and drops the oldest miss first."""
+        monkeypatch.setattr(projects, "NEGATIVE_CACHE_SIZE", 2)
+
+        for name in ("a", "b", "c"):
+            service.get_project(name)
+
+        assert list(service._neg_cache) == ["b", "c"]
+
+    def test_negative_cache_cleared_on_workspace_change(
+        self, workspace: Path, tmp_path: Path, service: ProjectService
+    ) -> None:
+        """Switching workspace_path drops misses from the old workspace."""
+        assert service.get_project("project") is None
+        other = tmp_path / "other"
+        os.mkdir(other)
+        make_repo(other, "project")
+
+        service.workspace_path = other
+
+        assert service.get_project("project") is not None
+
+    def test_resolved_workspace_follows_workspace_path_changes(
+        self, workspace: Path, tmp_path: Path, service: ProjectService
+    ) -> None:
+        """Resolved workspace is cached but refreshed when workspace_path changes."""
+        other = tmp_path / "other"
+        other.mkdir()
+
+        first = service._get_resolved_workspace()
+        assert service._get_resolved_workspace() is first
+
+        service.workspace_path = other
+        assert service._get_resolved_workspace() == other.resolve()
+
+
+class TestProjectServiceReadOnly:
+    """ProjectService tests that only read a shared, prebuilt workspace."""
+
+    @pytest.fixture(scope="session")
+    def canonical_workspace(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Build one canonical workspace layout for the whole session."""
+        root = tmp_path_factory.mktemp("readonly")
+        workspace = root / "projects"
+        os.mkdir(workspace)
+        for name in ("legit-project", "my-project", "project_v2", "project.name"):
+            make_repo(workspace, name)
+        make_repo(workspace, "real")
+        (workspace / "alias").symlink_to(workspace / "real")
+        make_repo(root, "outside")
+        (workspace / "escape").symlink_to(root / "outside")
+        return workspace
+
+    @pytest.fixture(scope="session")
+    def workspace_links(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Directory holding the per-test symlinks to the canonical layout."""
+        return tmp_path_factory.mktemp("workspace_links")
+
+    @pytest.fixture
+    def workspace(self, canonical_workspace: Path, workspace_links: Path) -> Path:
+        """Per-test workspace: a symlink to the shared canonical layout."""
+        link = workspace_links / f"ws{next(_link_ids)}"
+        link.symlink_to(canonical_workspace, target_is_directory=True)
+        return link
+
+    @pytest.fixture
+    def service(self, workspace: Path) -> ProjectService:
+        """Create a fresh ProjectService over the symlinked workspace."""
+        return ProjectService(workspace_path=workspace)
+
+    def test_list_projects_reports_canonical_paths(
+        self, canonical_workspace: Path, service: ProjectService
+    ) -> None:
+        """Listing via a symlinked workspace returns the same paths as lookups."""
+        listed = {p.id: p.path for p in service.list_projects()}
+        project = service.get_project("my-project")
+        alias = service.get_project("alias")
+
+        assert project is not None
+        assert listed["my-project"] == str(canonical_workspace / "my-project")
+        assert listed["my-project"] == project.path
+        # In-workspace symlinks list at their target, like get_project
+        assert alias is not None
+        assert listed["alias"] == str(canonical_workspace / "real")
+        assert listed["alias"] == alias.path
+        # Symlinks escaping the workspace are neither listed nor fetchable
+        assert "escape" not in listed
+        assert service.get_project("escape") is None
+
     # =========================================================================
     # Path Traversal Security Tests
     # =========================================================================
 
     def test_get_project_blocks_path_traversal_simple(
-        self, workspace: Path, service: ProjectService
+        self, service: ProjectService
     ) -> None:
         """get_project blocks simple path traversal attempts."""
-        # Create a project outside workspace that we should NOT be able to access
-        (workspace / "legit-project" / ".git").mkdir(parents=True)
-
         # Attempt path traversal
         result = service.get_project("../")
         assert result is None
 
     def test_get_project_blocks_path_traversal_deep(
-        self, workspace: Path, service: ProjectService
+        self, service: ProjectService
     ) -> None:
         """get_project blocks deep path traversal attempts."""
-        (workspace / "legit-project" / ".git").mkdir(parents=True)
-
         # Attempt to escape multiple directories
         result = service.get_project("../../..")
         assert result is None
 
     def test_get_project_blocks_path_traversal_with_subdir(
-        self, workspace: Path, service: ProjectService
+        self, service: ProjectService
     ) -> None:
         """get_project blocks path traversal with subdirectory."""
-        (workspace / "legit-project" / ".git").mkdir(parents=True)
-
         # Attempt traversal that looks like it ends in a valid path
         result = service.get_project("../workspace/legit-project")
         assert result is None
 
     def test_get_project_blocks_encoded_path_traversal(
-        self, workspace: Path, service: ProjectService
+        self, service: ProjectService
     ) -> None:
         """get_project blocks path traversal with mixed patterns."""
-        (workspace / "legit-project" / ".git").mkdir(parents=True)
-
         # Attempt traversal with nested ..
         result = service.get_project("legit-project/../../../etc")
         assert result is None
 
     def test_get_project_blocks_absolute_path_attempt(
-        self, workspace: Path, service: ProjectService
+        self, service: ProjectService
     ) -> None:
         """get_project blocks attempts to use absolute paths."""
-        (workspace / "legit-project" / ".git").mkdir(parents=True)
-
         # Attempt to access root (would fail anyway but should be caught)
         result = service.get_project("/etc/passwd")
         assert result is None
 
-    def test_get_project_allows_valid_project_names(
+    def test_get_project_blocks_symlink_escape(self, service: ProjectService) -> None:
+        """get_project rejects a symlink that points outside the workspace."""
+        assert service.get_project("escape") is None
+
+    def test_get_project_follows_symlink_within_workspace(
         self, workspace: Path, service: ProjectService
     ) -> None:
-        """get_project still allows valid project names with special chars."""
-        # Valid project names that might look suspicious but are legitimate
-        (workspace / "my-project" / ".git").mkdir(parents=True)
-        (workspace / "project_v2" / ".git").mkdir(parents=True)
-        (workspace / "project.name" / ".git").mkdir(parents=True)
+        """get_project resolves a symlink that stays inside the workspace."""
+        result = service.get_project("alias")
+
+        assert result is not None
+        assert result.path == str((workspace / "real").resolve())
+
+    @pytest.mark.parametrize(
+        "project_id", ["", ".", "..", ".hidden", "a/b", "a\\b", "x" * 129]
+    )
+    def test_get_project_rejects_invalid_names_before_filesystem(
+        self,
+        service: ProjectService,
+        project_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """get_project rejects malformed ids without any filesystem access."""
+
+        def fail(*args: object) -> None:
+            raise AssertionError("filesystem accessed")
 
+        monkeypatch.setattr(service, "_probe_project", fail)
+        monkeypatch.setattr(service, "_get_resolved_workspace", fail)
+
+        assert service.get_project(project_id) is None
+
+    def test_get_project_allows_valid_project_names(
+        self, service: ProjectService
+    ) -> None:
+        """get_project still allows valid project names with special chars."""
         assert service.get_project("my-project") is not None
         assert service.get_project("project_v2") is not None
         assert service.get_project("project.name") is not None
 
+    def test_get_project_does_not_scan_workspace(
+        self, service: ProjectService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_project probes only the named directory, never its siblings."""
+        probed: list[str] = []
+        probe = service._probe_project
+
+        def record(path: str) -> tuple[bool, bool]:
+            probed.append(path)
+            return probe(path)
+
+        def fail() -> None:
+            raise AssertionError("list_projects called")
+
+        monkeypatch.setattr(service, "list_projects", fail)
+        monkeypatch.setattr(service, "_probe_project", record)
+
+        assert service.get_project("my-project") is not None
+        assert [os.path.basename(p) for p in probed] == ["my-project"]
+
     def test_is_path_within_workspace_returns_true_for_valid(
         self, workspace: Path, service: ProjectService
     ) -> None: